@@ -89,7 +89,20 @@ def main():
     # We'll create data directory in current working directory if not exists
     os.makedirs('data', exist_ok=True)
 
-    loop = asyncio.new_event_loop()
+    loop = None
+
+    # libuv-backed event loop, not available on Windows
+    # set LANGBOT_DISABLE_UVLOOP=true to fall back to the stock asyncio loop, e.g. when debugging the loop itself
+    if os.environ.get('LANGBOT_DISABLE_UVLOOP', 'false').lower() not in ('1', 'true'):
+        try:
+            import uvloop
+
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            pass
+
+    if loop is None:
+        loop = asyncio.new_event_loop()
 
     try:
         loop.run_until_complete(main_entry(loop))
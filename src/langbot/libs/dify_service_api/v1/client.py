@@ -8,6 +8,14 @@ from .errors import DifyAPIError
 from pathlib import Path
 import os
 
+# 流式响应每个 data 行都要解析一次，安装了 orjson 时使用更快的解析器
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class AsyncDifyServiceClient:
     """Dify Service API 客户端"""
@@ -15,6 +23,8 @@ class AsyncDifyServiceClient:
     api_key: str
     base_url: str
 
+    _client: httpx.AsyncClient | None
+
     def __init__(
         self,
         api_key: str,
@@ -22,6 +32,23 @@ class AsyncDifyServiceClient:
     ) -> None:
         self.api_key = api_key
         self.base_url = base_url
+        self._client = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """获取长连接客户端，各次请求复用连接池"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                trust_env=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        """关闭客户端"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def chat_messages(
         self,
@@ -38,37 +65,34 @@ class AsyncDifyServiceClient:
         if response_mode != 'streaming':
             raise DifyAPIError('当前仅支持 streaming 模式')
 
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            trust_env=True,
+        client = self._get_client()
+        payload = {
+            'inputs': inputs,
+            'query': query,
+            'user': user,
+            'response_mode': response_mode,
+            'conversation_id': conversation_id,
+            'files': files,
+            'model_config': model_config or {},
+        }
+
+        async with client.stream(
+            'POST',
+            '/chat-messages',
+            headers={
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json',
+            },
+            json=payload,
             timeout=timeout,
-        ) as client:
-            payload = {
-                'inputs': inputs,
-                'query': query,
-                'user': user,
-                'response_mode': response_mode,
-                'conversation_id': conversation_id,
-                'files': files,
-                'model_config': model_config or {},
-            }
-
-            async with client.stream(
-                'POST',
-                '/chat-messages',
-                headers={
-                    'Authorization': f'Bearer {self.api_key}',
-                    'Content-Type': 'application/json',
-                },
-                json=payload,
-            ) as r:
-                async for chunk in r.aiter_lines():
-                    if r.status_code != 200:
-                        raise DifyAPIError(f'{r.status_code} {chunk}')
-                    if chunk.strip() == '':
-                        continue
-                    if chunk.startswith('data:'):
-                        yield json.loads(chunk[5:])
+        ) as r:
+            async for chunk in r.aiter_lines():
+                if r.status_code != 200:
+                    raise DifyAPIError(f'{r.status_code} {chunk}')
+                if chunk.strip() == '':
+                    continue
+                if chunk.startswith('data:'):
+                    yield _json_loads(chunk[5:])
 
     async def workflow_run(
         self,
@@ -82,32 +106,29 @@ class AsyncDifyServiceClient:
         if response_mode != 'streaming':
             raise DifyAPIError('当前仅支持 streaming 模式')
 
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            trust_env=True,
+        client = self._get_client()
+        async with client.stream(
+            'POST',
+            '/workflows/run',
+            headers={
+                'Authorization': f'Bearer {self.api_key}',
+                'Content-Type': 'application/json',
+            },
+            json={
+                'inputs': inputs,
+                'user': user,
+                'response_mode': response_mode,
+                'files': files,
+            },
             timeout=timeout,
-        ) as client:
-            async with client.stream(
-                'POST',
-                '/workflows/run',
-                headers={
-                    'Authorization': f'Bearer {self.api_key}',
-                    'Content-Type': 'application/json',
-                },
-                json={
-                    'inputs': inputs,
-                    'user': user,
-                    'response_mode': response_mode,
-                    'files': files,
-                },
-            ) as r:
-                async for chunk in r.aiter_lines():
-                    if r.status_code != 200:
-                        raise DifyAPIError(f'{r.status_code} {chunk}')
-                    if chunk.strip() == '':
-                        continue
-                    if chunk.startswith('data:'):
-                        yield json.loads(chunk[5:])
+        ) as r:
+            async for chunk in r.aiter_lines():
+                if r.status_code != 200:
+                    raise DifyAPIError(f'{r.status_code} {chunk}')
+                if chunk.strip() == '':
+                    continue
+                if chunk.startswith('data:'):
+                    yield _json_loads(chunk[5:])
 
     async def upload_file(
         self,
@@ -132,24 +153,21 @@ class AsyncDifyServiceClient:
         # 处理文件对象
         elif hasattr(file, 'read'):
             file = file.read()
-        async with httpx.AsyncClient(
-            base_url=self.base_url,
-            trust_env=True,
+        client = self._get_client()
+        # multipart/form-data
+        response = await client.post(
+            '/files/upload',
+            headers={'Authorization': f'Bearer {self.api_key}'},
+            files={
+                'file': file,
+            },
+            data={
+                'user': (None, user),
+            },
             timeout=timeout,
-        ) as client:
-            # multipart/form-data
-            response = await client.post(
-                '/files/upload',
-                headers={'Authorization': f'Bearer {self.api_key}'},
-                files={
-                    'file': file,
-                },
-                data={
-                    'user': (None, user),
-                },
-            )
+        )
 
-            if response.status_code != 201:
-                raise DifyAPIError(f'{response.status_code} {response.text}')
+        if response.status_code != 201:
+            raise DifyAPIError(f'{response.status_code} {response.text}')
 
-            return response.json()
+        return response.json()
@@ -18,7 +18,7 @@ from langbot.libs.wecom_ai_bot_api.WXBizMsgCrypt3 import WXBizMsgCrypt
 from langbot.pkg.platform.logger import EventLogger
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamChunk:
     """描述单次推送给企业微信的流式片段。"""
 
@@ -32,7 +32,7 @@ class StreamChunk:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamSession:
     """维护一次企业微信流式会话的上下文。"""
 
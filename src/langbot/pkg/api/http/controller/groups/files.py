@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import quart
 import mimetypes
-import uuid
+import secrets
 import asyncio
 
 import quart.datastructures
@@ -45,7 +45,9 @@ class FilesRouterGroup(group.RouterGroup):
             file = files['file']
             assert isinstance(file, quart.datastructures.FileStorage)
 
-            file_bytes = await asyncio.to_thread(file.stream.read)
+            # the multipart body is already parsed into the FileStorage; reading at most one byte past
+            # the limit only avoids copying more than that into a bytes object
+            file_bytes = await asyncio.to_thread(file.stream.read, group.MAX_FILE_SIZE + 1)
 
             # Double-check actual file size after reading
             if len(file_bytes) > group.MAX_FILE_SIZE:
@@ -66,7 +68,7 @@ class FilesRouterGroup(group.RouterGroup):
             if '/' in file_name or '\\' in file_name:
                 return self.fail(400, 'File name contains invalid characters')
 
-            file_key = file_name + '_' + str(uuid.uuid4())[:8] + '.' + extension
+            file_key = file_name + '_' + secrets.token_hex(4) + '.' + extension
 
             # save file to storage
             await self.ap.storage_mgr.storage_provider.save(file_key, file_bytes)
@@ -93,7 +95,9 @@ class FilesRouterGroup(group.RouterGroup):
             file = files['file']
             assert isinstance(file, quart.datastructures.FileStorage)
 
-            file_bytes = await asyncio.to_thread(file.stream.read)
+            # the multipart body is already parsed into the FileStorage; reading at most one byte past
+            # the limit only avoids copying more than that into a bytes object
+            file_bytes = await asyncio.to_thread(file.stream.read, group.MAX_FILE_SIZE + 1)
 
             # Double-check actual file size after reading
             if len(file_bytes) > group.MAX_FILE_SIZE:
@@ -110,7 +114,7 @@ class FilesRouterGroup(group.RouterGroup):
             if '/' in file_name or '\\' in file_name:
                 return self.fail(400, 'File name contains invalid characters')
 
-            file_key = file_name + '_' + str(uuid.uuid4())[:8]
+            file_key = file_name + '_' + secrets.token_hex(4)
             if extension:
                 file_key += '.' + extension
 
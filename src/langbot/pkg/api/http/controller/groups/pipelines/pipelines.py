@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 import quart
 
 from ... import group
@@ -13,9 +15,13 @@ class PipelinesRouterGroup(group.RouterGroup):
             if quart.request.method == 'GET':
                 sort_by = quart.request.args.get('sort_by', 'created_at')
                 sort_order = quart.request.args.get('sort_order', 'DESC')
-                return self.success(
-                    data={'pipelines': await self.ap.pipeline_service.get_pipelines(sort_by, sort_order)}
-                )
+                limit = quart.request.args.get('limit', None, type=int)
+                offset = quart.request.args.get('offset', 0, type=int)
+                if (limit is not None and limit < 0) or offset < 0:
+                    return self.fail(400, 'limit and offset must not be negative')
+
+                pipelines = await self.ap.pipeline_service.get_pipelines(sort_by, sort_order, limit, offset)
+                return self.success(data={'pipelines': pipelines})
             elif quart.request.method == 'POST':
                 json_data = await quart.request.json
 
@@ -23,9 +29,18 @@ class PipelinesRouterGroup(group.RouterGroup):
 
                 return self.success(data={'uuid': pipeline_uuid})
 
+        # pipeline config metadata is loaded from static templates at boot, so serialize it only once
+        metadata_body: bytes | None = None
+
         @self.route('/_/metadata', methods=['GET'], auth_type=group.AuthType.USER_TOKEN_OR_API_KEY)
-        async def _() -> str:
-            return self.success(data={'configs': await self.ap.pipeline_service.get_pipeline_metadata()})
+        async def _() -> quart.Response:
+            nonlocal metadata_body
+
+            if metadata_body is None:
+                configs = await self.ap.pipeline_service.get_pipeline_metadata()
+                metadata_body = json.dumps({'code': 0, 'msg': 'ok', 'data': {'configs': configs}}).encode('utf-8')
+
+            return quart.Response(metadata_body, mimetype='application/json')
 
         @self.route(
             '/<pipeline_uuid>', methods=['GET', 'PUT', 'DELETE'], auth_type=group.AuthType.USER_TOKEN_OR_API_KEY
@@ -12,6 +12,36 @@ from ......platform.sources.websocket_manager import ws_connection_manager
 
 logger = logging.getLogger(__name__)
 
+SEND_BATCH_SIZE = 32
+"""单次从发送队列中取出并合并的最大消息数"""
+
+
+def _coalesce_stream_responses(messages: list[dict]) -> list[dict]:
+    """合并同一条流式回复的中间状态
+
+    流式回复的每个 response 都携带截至当前的完整内容，因此同一批次中
+    同一条消息（session_type + id 相同）只需发送最后一个状态，已结束的消息始终保留。
+    """
+
+    def response_key(message: dict) -> tuple | None:
+        data = message.get('data')
+        if message.get('type') != 'response' or not isinstance(data, dict):
+            return None
+        return (message.get('session_type'), data.get('id'))
+
+    latest: dict[tuple, int] = {}
+    for index, message in enumerate(messages):
+        key = response_key(message)
+        if key is not None:
+            latest[key] = index
+
+    coalesced = []
+    for index, message in enumerate(messages):
+        key = response_key(message)
+        if key is None or latest[key] == index or message['data'].get('is_final'):
+            coalesced.append(message)
+    return coalesced
+
 
 @group.group_class('websocket_chat', '/api/v1/pipelines/<pipeline_uuid>/ws')
 class WebSocketChatRouterGroup(group.RouterGroup):
@@ -229,14 +259,18 @@ class WebSocketChatRouterGroup(group.RouterGroup):
                 # 从队列获取消息
                 try:
                     message = await asyncio.wait_for(connection.send_queue.get(), timeout=1.0)
-
-                    # 发送消息
-                    await quart.websocket.send(json.dumps(message))
-
                 except asyncio.TimeoutError:
                     # 超时继续循环
                     continue
 
+                # 取出队列中已积压的消息一起处理，合并同一条流式回复的中间状态后再发送
+                batch = [message]
+                while len(batch) < SEND_BATCH_SIZE and not connection.send_queue.empty():
+                    batch.append(connection.send_queue.get_nowait())
+
+                for message in _coalesce_stream_responses(batch):
+                    await quart.websocket.send(json.dumps(message))
+
         except Exception as e:
             logger.error(f'Send message error: {e}', exc_info=True)
         finally:
@@ -1,15 +1,20 @@
+import json
 import quart
 import mimetypes
 from ... import group
-from langbot.pkg.utils import importutil
 
 
 @group.group_class('adapters', '/api/v1/platform/adapters')
 class AdaptersRouterGroup(group.RouterGroup):
     async def initialize(self) -> None:
+        # adapter manifests are static for the process lifetime, so serialize the listing only once
+        adapters_body = json.dumps(
+            {'code': 0, 'msg': 'ok', 'data': {'adapters': self.ap.platform_mgr.get_available_adapters_info()}}
+        ).encode('utf-8')
+
         @self.route('', methods=['GET'])
-        async def _() -> str:
-            return self.success(data={'adapters': self.ap.platform_mgr.get_available_adapters_info()})
+        async def _() -> quart.Response:
+            return quart.Response(adapters_body, mimetype='application/json')
 
         @self.route('/<adapter_name>', methods=['GET'])
         async def _(adapter_name: str) -> str:
@@ -32,6 +37,4 @@ class AdaptersRouterGroup(group.RouterGroup):
             if icon_path is None:
                 return self.http_status(404, -1, 'icon not found')
 
-            return quart.Response(
-                importutil.read_resource_file_bytes(icon_path), mimetype=mimetypes.guess_type(icon_path)[0]
-            )
+            return quart.Response(adapter_manifest.get_icon_bytes(), mimetype=mimetypes.guess_type(icon_path)[0])
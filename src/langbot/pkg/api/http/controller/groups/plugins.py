@@ -318,7 +318,7 @@ class PluginsRouterGroup(group.RouterGroup):
 
             # Check file size (10MB limit)
             MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
-            file_bytes = file.read()
+            file_bytes = file.read(MAX_FILE_SIZE + 1)
             if len(file_bytes) > MAX_FILE_SIZE:
                 return self.http_status(400, -1, 'file size exceeds 10MB limit')
 
@@ -2,7 +2,6 @@ import quart
 import mimetypes
 
 from ... import group
-from langbot.pkg.utils import importutil
 
 
 @group.group_class('provider/requesters', '/api/v1/provider/requesters')
@@ -34,6 +33,4 @@ class RequestersRouterGroup(group.RouterGroup):
             if icon_path is None:
                 return self.http_status(404, -1, 'icon not found')
 
-            return quart.Response(
-                importutil.read_resource_file_bytes(icon_path), mimetype=mimetypes.guess_type(icon_path)[0]
-            )
+            return quart.Response(requester_manifest.get_icon_bytes(), mimetype=mimetypes.guess_type(icon_path)[0])
@@ -56,8 +56,8 @@ class HTTPController:
         if True:
 
             async def shutdown_trigger_placeholder():
-                while True:
-                    await asyncio.sleep(1)
+                # 永不触发的事件，挂起直到任务被取消，无需每秒唤醒轮询
+                await asyncio.Event().wait()
 
             async def exception_handler(*args, **kwargs):
                 try:
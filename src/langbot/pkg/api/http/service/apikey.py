@@ -10,8 +10,12 @@ from ....entity.persistence import apikey
 class ApiKeyService:
     ap: app.Application
 
+    _verified_keys: set[str]
+    """Keys already verified against the database, checked on every API-key authenticated request"""
+
     def __init__(self, ap: app.Application) -> None:
         self.ap = ap
+        self._verified_keys = set()
 
     async def get_api_keys(self) -> list[dict]:
         """Get all API keys"""
@@ -52,17 +56,27 @@ class ApiKeyService:
 
     async def verify_api_key(self, key: str) -> bool:
         """Verify if an API key is valid"""
+        if key in self._verified_keys:
+            return True
+
         result = await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.select(apikey.ApiKey).where(apikey.ApiKey.key == key)
+            sqlalchemy.select(apikey.ApiKey.id).where(apikey.ApiKey.key == key)
         )
 
-        key_obj = result.first()
-        return key_obj is not None
+        # only valid keys are cached, so arbitrary invalid keys can't grow the set
+        if result.first() is None:
+            return False
+
+        self._verified_keys.add(key)
+        return True
 
     async def delete_api_key(self, key_id: int) -> None:
         """Delete an API key"""
         await self.ap.persistence_mgr.execute_async(sqlalchemy.delete(apikey.ApiKey).where(apikey.ApiKey.id == key_id))
 
+        # the deleted key's value is not known here, drop all and let valid keys be re-verified
+        self._verified_keys.clear()
+
     async def update_api_key(self, key_id: int, name: str = None, description: str = None) -> None:
         """Update an API key's metadata (name, description)"""
         update_data = {}
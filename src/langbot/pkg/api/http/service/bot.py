@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import collections
 import uuid
 import sqlalchemy
 import typing
@@ -9,13 +11,25 @@ from ....entity.persistence import bot as persistence_bot
 from ....entity.persistence import pipeline as persistence_pipeline
 
 
+BOT_METADATA_FIELDS = frozenset({'description', 'use_pipeline_name'})
+"""Bot fields that are display-only and do not affect the running adapter"""
+
+
 class BotService:
     """Bot service"""
 
     ap: app.Application
 
+    bot_locks: collections.defaultdict[str, asyncio.Lock]
+    """Per-bot locks serializing the write-remove-reload sequence of concurrent updates and deletes
+
+    Locks are never dropped, even after the bot is deleted: a coroutine may still be waiting on one,
+    and handing the next caller a fresh lock would let two reloads of the same bot run at once.
+    """
+
     def __init__(self, ap: app.Application) -> None:
         self.ap = ap
+        self.bot_locks = collections.defaultdict(asyncio.Lock)
 
     async def get_bots(self, include_secret: bool = True) -> list[dict]:
         """获取所有机器人"""
@@ -88,9 +102,14 @@ class BotService:
             bot_data['use_pipeline_uuid'] = pipeline.uuid
             bot_data['use_pipeline_name'] = pipeline.name
 
-        await self.ap.persistence_mgr.execute_async(sqlalchemy.insert(persistence_bot.Bot).values(bot_data))
+        stmt = sqlalchemy.insert(persistence_bot.Bot).values(bot_data)
 
-        bot = await self.get_bot(bot_data['uuid'])
+        if self.ap.persistence_mgr.supports_returning():
+            result = await self.ap.persistence_mgr.execute_async(stmt.returning(persistence_bot.Bot))
+            bot = self.ap.persistence_mgr.serialize_model(persistence_bot.Bot, result.first())
+        else:
+            await self.ap.persistence_mgr.execute_async(stmt)
+            bot = await self.get_bot(bot_data['uuid'])
 
         await self.ap.platform_mgr.load_bot(bot)
 
@@ -114,18 +133,39 @@ class BotService:
             else:
                 raise Exception('Pipeline not found')
 
-        await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.update(persistence_bot.Bot).values(bot_data).where(persistence_bot.Bot.uuid == bot_uuid)
-        )
-        await self.ap.platform_mgr.remove_bot(bot_uuid)
+        stmt = sqlalchemy.update(persistence_bot.Bot).values(bot_data).where(persistence_bot.Bot.uuid == bot_uuid)
+
+        # metadata-only updates (e.g. the bound pipeline was renamed) are applied to the
+        # running bot in place instead of tearing down and reconnecting its adapter
+        # still taken under the bot lock, so a concurrent full reload cannot load the row from before this write
+        if bot_data.keys() <= BOT_METADATA_FIELDS:
+            async with self.bot_locks[bot_uuid]:
+                await self.ap.persistence_mgr.execute_async(stmt)
+
+                runtime_bot = await self.ap.platform_mgr.get_bot_by_uuid(bot_uuid)
+                if runtime_bot is not None:
+                    for key, value in bot_data.items():
+                        setattr(runtime_bot.bot_entity, key, value)
+            return
+
+        # without the lock two overlapping updates could both load the bot, leaving an orphaned adapter running
+        async with self.bot_locks[bot_uuid]:
+            if self.ap.persistence_mgr.supports_returning():
+                result = await self.ap.persistence_mgr.execute_async(stmt.returning(persistence_bot.Bot))
+                row = result.first()
+                bot = None if row is None else self.ap.persistence_mgr.serialize_model(persistence_bot.Bot, row)
+                await self.ap.platform_mgr.remove_bot(bot_uuid)
+            else:
+                await self.ap.persistence_mgr.execute_async(stmt)
+                await self.ap.platform_mgr.remove_bot(bot_uuid)
 
-        # select from db
-        bot = await self.get_bot(bot_uuid)
+                # select from db
+                bot = await self.get_bot(bot_uuid)
 
-        runtime_bot = await self.ap.platform_mgr.load_bot(bot)
+            runtime_bot = await self.ap.platform_mgr.load_bot(bot)
 
-        if runtime_bot.enable:
-            await runtime_bot.run()
+            if runtime_bot.enable:
+                await runtime_bot.run()
 
         # update all conversation that use this bot
         for session in self.ap.sess_mgr.session_list:
@@ -134,10 +174,11 @@ class BotService:
 
     async def delete_bot(self, bot_uuid: str) -> None:
         """Delete bot"""
-        await self.ap.platform_mgr.remove_bot(bot_uuid)
-        await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.delete(persistence_bot.Bot).where(persistence_bot.Bot.uuid == bot_uuid)
-        )
+        async with self.bot_locks[bot_uuid]:
+            await self.ap.platform_mgr.remove_bot(bot_uuid)
+            await self.ap.persistence_mgr.execute_async(
+                sqlalchemy.delete(persistence_bot.Bot).where(persistence_bot.Bot.uuid == bot_uuid)
+            )
 
     async def list_event_logs(
         self, bot_uuid: str, from_index: int, max_count: int
@@ -123,20 +123,10 @@ class KnowledgeService:
         """删除知识库"""
         await self.ap.rag_mgr.delete_knowledge_base(kb_uuid)
 
-        await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.delete(persistence_rag.KnowledgeBase).where(persistence_rag.KnowledgeBase.uuid == kb_uuid)
-        )
-
-        # delete files
-        files = await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.select(persistence_rag.File).where(persistence_rag.File.kb_id == kb_uuid)
+        # delete chunks, files and the knowledge base itself in one transaction
+        kb_file_ids = sqlalchemy.select(persistence_rag.File.uuid).where(persistence_rag.File.kb_id == kb_uuid)
+        await self.ap.persistence_mgr.execute_many_async(
+            sqlalchemy.delete(persistence_rag.Chunk).where(persistence_rag.Chunk.file_id.in_(kb_file_ids)),
+            sqlalchemy.delete(persistence_rag.File).where(persistence_rag.File.kb_id == kb_uuid),
+            sqlalchemy.delete(persistence_rag.KnowledgeBase).where(persistence_rag.KnowledgeBase.uuid == kb_uuid),
         )
-        for file in files:
-            # delete chunks
-            await self.ap.persistence_mgr.execute_async(
-                sqlalchemy.delete(persistence_rag.Chunk).where(persistence_rag.Chunk.file_id == file.uuid)
-            )
-            # delete file
-            await self.ap.persistence_mgr.execute_async(
-                sqlalchemy.delete(persistence_rag.File).where(persistence_rag.File.uuid == file.uuid)
-            )
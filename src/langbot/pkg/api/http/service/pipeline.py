@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import functools
 import uuid
 import json
 import sqlalchemy
@@ -8,6 +10,13 @@ from ....core import app
 from ....entity.persistence import pipeline as persistence_pipeline
 
 
+@functools.lru_cache(maxsize=4)
+def _load_pipeline_config_template(template_path: str) -> dict:
+    """Parse the pipeline config template once, the packaged template does not change at runtime"""
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 default_stage_order = [
     'GroupRespondRuleCheckStage',  # 群响应规则检查
     'BanSessionCheckStage',  # 封禁会话检查
@@ -23,6 +32,16 @@ default_stage_order = [
     'SendResponseBackStage',  # 发送响应
 ]
 
+readonly_pipeline_fields = frozenset({'uuid', 'for_version', 'stages', 'is_default'})
+"""Pipeline fields managed by the system that update_pipeline never writes"""
+
+# columns that pipelines may be sorted by, unknown sort keys leave the order unspecified
+pipeline_sort_columns = {
+    'created_at': persistence_pipeline.LegacyPipeline.created_at,
+    'updated_at': persistence_pipeline.LegacyPipeline.updated_at,
+    'name': persistence_pipeline.LegacyPipeline.name,
+}
+
 
 class PipelineService:
     ap: app.Application
@@ -38,19 +57,23 @@ class PipelineService:
             self.ap.pipeline_config_meta_output,
         ]
 
-    async def get_pipelines(self, sort_by: str = 'created_at', sort_order: str = 'DESC') -> list[dict]:
+    async def get_pipelines(
+        self,
+        sort_by: str = 'created_at',
+        sort_order: str = 'DESC',
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[dict]:
         query = sqlalchemy.select(persistence_pipeline.LegacyPipeline)
 
-        if sort_by == 'created_at':
-            if sort_order == 'DESC':
-                query = query.order_by(persistence_pipeline.LegacyPipeline.created_at.desc())
-            else:
-                query = query.order_by(persistence_pipeline.LegacyPipeline.created_at.asc())
-        elif sort_by == 'updated_at':
-            if sort_order == 'DESC':
-                query = query.order_by(persistence_pipeline.LegacyPipeline.updated_at.desc())
-            else:
-                query = query.order_by(persistence_pipeline.LegacyPipeline.updated_at.asc())
+        sort_column = pipeline_sort_columns.get(sort_by)
+        if sort_column is not None:
+            query = query.order_by(sort_column.desc() if sort_order == 'DESC' else sort_column.asc())
+
+        if limit is not None:
+            query = query.limit(limit)
+        if offset:
+            query = query.offset(offset)
 
         result = await self.ap.persistence_mgr.execute_async(query)
         pipelines = result.all()
@@ -82,8 +105,8 @@ class PipelineService:
         pipeline_data['is_default'] = default
 
         template_path = path_utils.get_resource_path('templates/default-pipeline-config.json')
-        with open(template_path, 'r', encoding='utf-8') as f:
-            pipeline_data['config'] = json.load(f)
+        # copy so that the cached template is never mutated through the new pipeline's config
+        pipeline_data['config'] = copy.deepcopy(_load_pipeline_config_template(template_path))
 
         # Ensure extensions_preferences is set with enable_all_plugins and enable_all_mcp_servers=True by default
         if 'extensions_preferences' not in pipeline_data:
@@ -94,33 +117,39 @@ class PipelineService:
                 'mcp_servers': [],
             }
 
-        await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.insert(persistence_pipeline.LegacyPipeline).values(**pipeline_data)
-        )
+        stmt = sqlalchemy.insert(persistence_pipeline.LegacyPipeline).values(**pipeline_data)
 
-        pipeline = await self.get_pipeline(pipeline_data['uuid'])
+        if self.ap.persistence_mgr.supports_returning():
+            result = await self.ap.persistence_mgr.execute_async(stmt.returning(persistence_pipeline.LegacyPipeline))
+            pipeline = self.ap.persistence_mgr.serialize_model(persistence_pipeline.LegacyPipeline, result.first())
+        else:
+            await self.ap.persistence_mgr.execute_async(stmt)
+            pipeline = await self.get_pipeline(pipeline_data['uuid'])
 
         await self.ap.pipeline_mgr.load_pipeline(pipeline)
 
         return pipeline_data['uuid']
 
     async def update_pipeline(self, pipeline_uuid: str, pipeline_data: dict) -> None:
-        if 'uuid' in pipeline_data:
-            del pipeline_data['uuid']
-        if 'for_version' in pipeline_data:
-            del pipeline_data['for_version']
-        if 'stages' in pipeline_data:
-            del pipeline_data['stages']
-        if 'is_default' in pipeline_data:
-            del pipeline_data['is_default']
+        pipeline_data = {key: value for key, value in pipeline_data.items() if key not in readonly_pipeline_fields}
 
-        await self.ap.persistence_mgr.execute_async(
+        stmt = (
             sqlalchemy.update(persistence_pipeline.LegacyPipeline)
             .where(persistence_pipeline.LegacyPipeline.uuid == pipeline_uuid)
             .values(**pipeline_data)
         )
 
-        pipeline = await self.get_pipeline(pipeline_uuid)
+        if self.ap.persistence_mgr.supports_returning():
+            result = await self.ap.persistence_mgr.execute_async(stmt.returning(persistence_pipeline.LegacyPipeline))
+            row = result.first()
+            pipeline = (
+                None
+                if row is None
+                else self.ap.persistence_mgr.serialize_model(persistence_pipeline.LegacyPipeline, row)
+            )
+        else:
+            await self.ap.persistence_mgr.execute_async(stmt)
+            pipeline = await self.get_pipeline(pipeline_uuid)
 
         if 'name' in pipeline_data:
             from ....entity.persistence import bot as persistence_bot
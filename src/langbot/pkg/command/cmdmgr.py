@@ -87,6 +87,9 @@ class CommandManager:
         if f'{query.launcher_type.value}_{query.launcher_id}' in self.ap.instance_config.data['admins']:
             privilege = 2
 
+        # 只切分一次，crt_params 会在 shift 时被修改，因此使用副本
+        params = command_text.split(' ')
+
         ctx = command_context.ExecuteContext(
             query_id=query.query_id,
             session=session,
@@ -94,8 +97,8 @@ class CommandManager:
             full_command_text=full_command_text,
             command='',
             crt_command='',
-            params=command_text.split(' '),
-            crt_params=command_text.split(' '),
+            params=params,
+            crt_params=list(params),
             privilege=privilege,
         )
 
@@ -1,4 +1,5 @@
 import os
+import aiofiles
 import json
 import importlib.resources as resources
 
@@ -31,12 +32,13 @@ class JSONConfigFile(file_model.ConfigFile):
             return f.read()
 
     async def create(self):
-        if await self.get_template_file_str() is not None:
-            with open(self.config_file_name, 'w', encoding='utf-8') as f:
-                f.write(await self.get_template_file_str())
+        template_file_str = await self.get_template_file_str()
+        if template_file_str is not None:
+            async with aiofiles.open(self.config_file_name, 'w', encoding='utf-8') as f:
+                await f.write(template_file_str)
         elif self.template_data is not None:
-            with open(self.config_file_name, 'w', encoding='utf-8') as f:
-                json.dump(self.template_data, f, indent=4, ensure_ascii=False)
+            async with aiofiles.open(self.config_file_name, 'w', encoding='utf-8') as f:
+                await f.write(json.dumps(self.template_data, indent=4, ensure_ascii=False))
         else:
             raise ValueError('template_file_name or template_data must be provided')
 
@@ -49,11 +51,13 @@ class JSONConfigFile(file_model.ConfigFile):
         if template_file_str is not None:
             self.template_data = json.loads(template_file_str)
 
-        with open(self.config_file_name, 'r', encoding='utf-8') as f:
-            try:
-                cfg = json.load(f)
-            except json.JSONDecodeError as e:
-                raise Exception(f'Syntax error in config file {self.config_file_name}: {e}')
+        async with aiofiles.open(self.config_file_name, 'r', encoding='utf-8') as f:
+            cfg_str = await f.read()
+
+        try:
+            cfg = json.loads(cfg_str)
+        except json.JSONDecodeError as e:
+            raise Exception(f'Syntax error in config file {self.config_file_name}: {e}')
 
         if completion:
             for key in self.template_data:
@@ -63,8 +67,8 @@ class JSONConfigFile(file_model.ConfigFile):
         return cfg
 
     async def save(self, cfg: dict):
-        with open(self.config_file_name, 'w', encoding='utf-8') as f:
-            json.dump(cfg, f, indent=4, ensure_ascii=False)
+        async with aiofiles.open(self.config_file_name, 'w', encoding='utf-8') as f:
+            await f.write(json.dumps(cfg, indent=4, ensure_ascii=False))
 
     def save_sync(self, cfg: dict):
         with open(self.config_file_name, 'w', encoding='utf-8') as f:
@@ -1,9 +1,14 @@
 import os
+import aiofiles
 import yaml
 import importlib.resources as resources
 
 from langbot.pkg.config import model as file_model
 
+# use the libyaml-backed loader/dumper when available, same semantics as the pure-Python ones
+_YamlLoader = getattr(yaml, 'CFullLoader', yaml.FullLoader)
+_YamlDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
 
 class YAMLConfigFile(file_model.ConfigFile):
     """YAML config file"""
@@ -31,12 +36,13 @@ class YAMLConfigFile(file_model.ConfigFile):
             return f.read()
 
     async def create(self):
-        if await self.get_template_file_str() is not None:
-            with open(self.config_file_name, 'w', encoding='utf-8') as f:
-                f.write(await self.get_template_file_str())
+        template_file_str = await self.get_template_file_str()
+        if template_file_str is not None:
+            async with aiofiles.open(self.config_file_name, 'w', encoding='utf-8') as f:
+                await f.write(template_file_str)
         elif self.template_data is not None:
-            with open(self.config_file_name, 'w', encoding='utf-8') as f:
-                yaml.dump(self.template_data, f, indent=4, allow_unicode=True)
+            async with aiofiles.open(self.config_file_name, 'w', encoding='utf-8') as f:
+                await f.write(yaml.dump(self.template_data, indent=4, allow_unicode=True, Dumper=_YamlDumper))
         else:
             raise ValueError('template_file_name or template_data must be provided')
 
@@ -47,13 +53,15 @@ class YAMLConfigFile(file_model.ConfigFile):
         template_file_str = await self.get_template_file_str()
 
         if template_file_str is not None:
-            self.template_data = yaml.load(template_file_str, Loader=yaml.FullLoader)
+            self.template_data = yaml.load(template_file_str, Loader=_YamlLoader)
 
-        with open(self.config_file_name, 'r', encoding='utf-8') as f:
-            try:
-                cfg = yaml.load(f, Loader=yaml.FullLoader)
-            except yaml.YAMLError as e:
-                raise Exception(f'Syntax error in config file {self.config_file_name}: {e}')
+        async with aiofiles.open(self.config_file_name, 'r', encoding='utf-8') as f:
+            cfg_str = await f.read()
+
+        try:
+            cfg = yaml.load(cfg_str, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise Exception(f'Syntax error in config file {self.config_file_name}: {e}')
 
         if completion:
             for key in self.template_data:
@@ -63,9 +71,9 @@ class YAMLConfigFile(file_model.ConfigFile):
         return cfg
 
     async def save(self, cfg: dict):
-        with open(self.config_file_name, 'w', encoding='utf-8') as f:
-            yaml.dump(cfg, f, indent=4, allow_unicode=True)
+        async with aiofiles.open(self.config_file_name, 'w', encoding='utf-8') as f:
+            await f.write(yaml.dump(cfg, indent=4, allow_unicode=True, Dumper=_YamlDumper))
 
     def save_sync(self, cfg: dict):
         with open(self.config_file_name, 'w', encoding='utf-8') as f:
-            yaml.dump(cfg, f, indent=4, allow_unicode=True)
+            yaml.dump(cfg, f, indent=4, allow_unicode=True, Dumper=_YamlDumper)
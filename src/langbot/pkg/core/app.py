@@ -145,8 +145,8 @@ class Application:
             # 后续可能会允许动态重启其他任务
             # 故为了防止程序在非 Ctrl-C 情况下退出，这里创建一个不会结束的协程
             async def never_ending():
-                while True:
-                    await asyncio.sleep(1)
+                # 挂起在一个永不设置的事件上，直到被取消，不做定时唤醒
+                await asyncio.Event().wait()
 
             self.task_mgr.create_task(
                 self.platform_mgr.run(),
@@ -180,6 +180,9 @@ class Application:
         except Exception as e:
             self.logger.error(f'Application runtime fatal exception: {e}')
             self.logger.debug(f'Traceback: {traceback.format_exc()}')
+        finally:
+            if self.webhook_pusher is not None:
+                await self.webhook_pusher.shutdown()
 
     def dispose(self):
         self.plugin_connector.dispose()
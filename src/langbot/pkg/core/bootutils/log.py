@@ -21,6 +21,30 @@ LOG_FILE_MAX_BYTES = 10 * 1024 * 1024  # 10MB per file
 LOG_FILE_BACKUP_COUNT = 5  # Keep 5 backup files (total ~50MB max)
 
 
+class SecondCachedColoredFormatter(colorlog.ColoredFormatter):
+    """Formatter that formats asctime at most once per second
+
+    datefmt only has second precision and msecs are appended by the format string,
+    so every record within the same second (and every handler sharing this formatter)
+    reuses the same strftime result.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, asctime) kept in one tuple so concurrent threads never see a mismatched pair
+        self._asctime_cache: tuple[int, str] = (-1, '')
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        second = int(record.created)
+        cached_second, cached_asctime = self._asctime_cache
+        if second == cached_second:
+            return cached_asctime
+
+        asctime = super().formatTime(record, datefmt)
+        self._asctime_cache = (second, asctime)
+        return asctime
+
+
 async def init_logging(extra_handlers: list[logging.Handler] = None) -> logging.Logger:
     # Remove all existing loggers
     for handler in logging.root.handlers[:]:
@@ -37,7 +61,7 @@ async def init_logging(extra_handlers: list[logging.Handler] = None) -> logging.
 
     qcg_logger.setLevel(level)
 
-    color_formatter = colorlog.ColoredFormatter(
+    color_formatter = SecondCachedColoredFormatter(
         fmt='%(log_color)s[%(asctime)s.%(msecs)03d] %(filename)s (%(lineno)d) - [%(levelname)s] : %(message)s',
         datefmt='%m-%d %H:%M:%S',
         log_colors=log_colors_config,
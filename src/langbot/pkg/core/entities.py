@@ -3,7 +3,7 @@ from __future__ import annotations
 import enum
 
 
-class LifecycleControlScope(enum.Enum):
+class LifecycleControlScope(enum.StrEnum):
     APPLICATION = 'application'
     PLATFORM = 'platform'
     PLUGIN = 'plugin'
@@ -150,7 +150,7 @@ class LoadConfigStage(stage.BootingStage):
 
         async def load_resource_yaml_template_data(resource_name: str) -> dict:
             with resources.files('langbot.templates').joinpath(resource_name).open('r', encoding='utf-8') as f:
-                return yaml.load(f, Loader=yaml.FullLoader)
+                return yaml.load(f, Loader=getattr(yaml, 'CFullLoader', yaml.FullLoader))
 
         ap.pipeline_config_meta_trigger = await load_resource_yaml_template_data('metadata/pipeline/trigger.yaml')
         ap.pipeline_config_meta_safety = await load_resource_yaml_template_data('metadata/pipeline/safety.yaml')
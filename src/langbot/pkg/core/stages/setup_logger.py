@@ -40,7 +40,6 @@ class SetupLoggerStage(stage.BootingStage):
         """Setup logger"""
         persistence_handler = PersistenceHandler('LoggerHandler', ap)
 
-        extra_handlers = []
         extra_handlers = [persistence_handler]
 
         ap.logger = await log.init_logging(extra_handlers)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import time
 import typing
 import datetime
 
@@ -8,21 +10,36 @@ from . import app
 from . import entities as core_entities
 
 
+MAX_LOG_RECORDS = 1000
+"""Maximum number of log records kept per task context, older records are dropped first"""
+
+
 class TaskContext:
     """Task tracking context"""
 
     current_action: str
     """Current action being executed"""
 
-    log: str
-    """Log"""
+    log_records: collections.deque[tuple[float, str, str]]
+    """Log records as (timestamp, action, message), formatted only when the log is read"""
+
+    _log_cache: str | None
+    """Formatted log, reused by repeated reads until the next trace"""
 
     def __init__(self):
         self.current_action = 'default'
-        self.log = ''
-
-    def _log(self, msg: str):
-        self.log += msg + '\n'
+        self.log_records = collections.deque(maxlen=MAX_LOG_RECORDS)
+        self._log_cache = None
+
+    @property
+    def log(self) -> str:
+        """Log"""
+        if self._log_cache is None:
+            self._log_cache = ''.join(
+                f'{datetime.datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")} | {action} | {msg}\n'
+                for timestamp, action, msg in self.log_records
+            )
+        return self._log_cache
 
     def set_current_action(self, action: str):
         self.current_action = action
@@ -35,7 +52,8 @@ class TaskContext:
         if action is not None:
             self.set_current_action(action)
 
-        self._log(f'{datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | {self.current_action} | {msg}')
+        self.log_records.append((time.time(), self.current_action, msg))
+        self._log_cache = None
 
     def to_dict(self) -> dict:
         return {'current_action': self.current_action, 'log': self.log}
@@ -132,8 +150,9 @@ class TaskWrapper:
             return None
 
     def to_dict(self) -> dict:
+        exception = self.assume_exception()
         exception_traceback = None
-        if self.assume_exception() is not None:
+        if exception is not None:
             exception_traceback = 'Traceback (most recent call last):\n'
 
             for frame in self.task_stack:
@@ -141,7 +160,7 @@ class TaskWrapper:
                     f'  File "{frame.f_code.co_filename}", line {frame.f_lineno}, in {frame.f_code.co_name}\n'
                 )
 
-            exception_traceback += f'    {self.assume_exception().__str__()}\n'
+            exception_traceback += f'    {exception.__str__()}\n'
 
         return {
             'id': self.id,
@@ -149,14 +168,14 @@ class TaskWrapper:
             'kind': self.kind,
             'name': self.name,
             'label': self.label,
-            'scopes': [scope.value for scope in self.scopes],
+            'scopes': list(self.scopes),
             'task_context': self.task_context.to_dict(),
             'runtime': {
                 'done': self.task.done(),
                 'state': self.task._state,
-                'exception': self.assume_exception().__str__() if self.assume_exception() is not None else None,
+                'exception': exception.__str__() if exception is not None else None,
                 'exception_traceback': exception_traceback,
-                'result': self.assume_result() if self.assume_result() is not None else None,
+                'result': self.assume_result(),
             },
         }
 
@@ -9,6 +9,9 @@ import pydantic
 from langbot.pkg.core import app
 from langbot.pkg.utils import importutil
 
+# Prefer the libyaml C loader when available, all component manifests are parsed at boot
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class I18nString(pydantic.BaseModel):
     """国际化字符串"""
@@ -115,6 +118,9 @@ class Component(pydantic.BaseModel):
     _execution: Execution
     """组件执行"""
 
+    _icon_bytes: typing.Optional[bytes] = None
+    """图标文件内容，首次读取后缓存"""
+
     def __init__(self, owner: str, manifest: typing.Dict[str, typing.Any], rel_path: str):
         super().__init__(
             owner=owner,
@@ -160,6 +166,12 @@ class Component(pydantic.BaseModel):
             else None
         )
 
+    def get_icon_bytes(self) -> bytes:
+        """获取图标文件内容，清单在进程生命周期内不变，只读取一次"""
+        if self._icon_bytes is None:
+            self._icon_bytes = importutil.read_resource_file_bytes(self.icon_rel_path)
+        return self._icon_bytes
+
     def get_python_component_class(self) -> typing.Type[typing.Any]:
         """获取Python组件类"""
         module_path = os.path.join(self.rel_dir, self.execution.python.path)
@@ -196,7 +208,7 @@ class ComponentDiscoveryEngine:
         """加载组件清单"""
         # with open(path, 'r', encoding='utf-8') as f:
         #     manifest = yaml.safe_load(f)
-        manifest = yaml.safe_load(importutil.read_resource_file(path))
+        manifest = yaml.load(importutil.read_resource_file(path), Loader=_YamlLoader)
         if not Component.is_component_manifest(manifest):
             return None
         comp = Component(owner=owner, manifest=manifest, rel_path=path)
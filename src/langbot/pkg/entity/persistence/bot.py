@@ -10,12 +10,12 @@ class Bot(Base):
 
     uuid = sqlalchemy.Column(sqlalchemy.String(255), primary_key=True, unique=True)
     name = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
-    description = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    description = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
     adapter = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
     adapter_config = sqlalchemy.Column(sqlalchemy.JSON, nullable=False)
     enable = sqlalchemy.Column(sqlalchemy.Boolean, nullable=False, default=False)
     use_pipeline_name = sqlalchemy.Column(sqlalchemy.String(255), nullable=True)
-    use_pipeline_uuid = sqlalchemy.Column(sqlalchemy.String(255), nullable=True)
+    use_pipeline_uuid = sqlalchemy.Column(sqlalchemy.String(255), nullable=True, index=True)
     created_at = sqlalchemy.Column(sqlalchemy.DateTime, nullable=False, server_default=sqlalchemy.func.now())
     updated_at = sqlalchemy.Column(
         sqlalchemy.DateTime,
@@ -10,7 +10,7 @@ class LLMModel(Base):
 
     uuid = sqlalchemy.Column(sqlalchemy.String(255), primary_key=True, unique=True)
     name = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
-    description = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    description = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
     requester = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
     requester_config = sqlalchemy.Column(sqlalchemy.JSON, nullable=False, default={})
     api_keys = sqlalchemy.Column(sqlalchemy.JSON, nullable=False)
@@ -32,7 +32,7 @@ class EmbeddingModel(Base):
 
     uuid = sqlalchemy.Column(sqlalchemy.String(255), primary_key=True, unique=True)
     name = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
-    description = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
+    description = sqlalchemy.Column(sqlalchemy.Text, nullable=False)
     requester = sqlalchemy.Column(sqlalchemy.String(255), nullable=False)
     requester_config = sqlalchemy.Column(sqlalchemy.JSON, nullable=False, default={})
     api_keys = sqlalchemy.Column(sqlalchemy.JSON, nullable=False)
@@ -16,7 +16,7 @@ class KnowledgeBase(Base):
 class File(Base):
     __tablename__ = 'knowledge_base_files'
     uuid = sqlalchemy.Column(sqlalchemy.String(255), primary_key=True, unique=True)
-    kb_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True)
+    kb_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True, index=True)
     file_name = sqlalchemy.Column(sqlalchemy.String)
     extension = sqlalchemy.Column(sqlalchemy.String)
     created_at = sqlalchemy.Column(sqlalchemy.DateTime, default=sqlalchemy.func.now())
@@ -26,7 +26,7 @@ class File(Base):
 class Chunk(Base):
     __tablename__ = 'knowledge_base_chunks'
     uuid = sqlalchemy.Column(sqlalchemy.String(255), primary_key=True, unique=True)
-    file_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True)
+    file_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True, index=True)
     text = sqlalchemy.Column(sqlalchemy.Text)
 
 
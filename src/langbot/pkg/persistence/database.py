@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import abc
+import functools
+import json
 
 import sqlalchemy.ext.asyncio as sqlalchemy_asyncio
 
@@ -9,6 +11,9 @@ from ..core import app
 
 preregistered_managers: list[type[BaseDatabaseManager]] = []
 
+json_serializer = functools.partial(json.dumps, ensure_ascii=False, separators=(',', ':'))
+"""Serializer for JSON columns, compact and without escaping non-ASCII text into \\uXXXX sequences"""
+
 
 def manager_class(name: str) -> None:
     """Register a database manager class"""
@@ -18,4 +18,4 @@ class PostgreSQLDatabaseManager(database.BaseDatabaseManager):
         password = postgresql_config.get('password', 'postgres')
         database = postgresql_config.get('database', 'postgres')
         engine_url = f'postgresql+asyncpg://{user}:{password}@{host}:{port}/{database}'
-        self.engine = sqlalchemy_asyncio.create_async_engine(engine_url)
+        self.engine = sqlalchemy_asyncio.create_async_engine(engine_url, json_serializer=database.json_serializer)
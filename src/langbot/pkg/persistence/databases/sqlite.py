@@ -12,4 +12,4 @@ class SQLiteDatabaseManager(database.BaseDatabaseManager):
     async def initialize(self) -> None:
         db_file_path = self.ap.instance_config.data.get('database', {}).get('sqlite', {}).get('path', 'data/langbot.db')
         engine_url = f'sqlite+aiosqlite:///{db_file_path}'
-        self.engine = sqlalchemy_asyncio.create_async_engine(engine_url)
+        self.engine = sqlalchemy_asyncio.create_async_engine(engine_url, json_serializer=database.json_serializer)
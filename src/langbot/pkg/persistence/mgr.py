@@ -31,9 +31,12 @@ class PersistenceManager:
 
     meta: sqlalchemy.MetaData
 
+    _column_names_cache: dict[typing.Type[sqlalchemy.Base], tuple[str, ...]]
+
     def __init__(self, ap: app.Application):
         self.ap = ap
         self.meta = base.Base.metadata
+        self._column_names_cache = {}
 
     async def initialize(self):
         database_type = self.ap.instance_config.data.get('database', {}).get('use', 'sqlite')
@@ -131,16 +134,39 @@ class PersistenceManager:
             await conn.commit()
             return result
 
+    async def execute_many_async(self, *statements) -> list[sqlalchemy.engine.cursor.CursorResult]:
+        """Execute statements in order on one connection, committed as a single transaction"""
+        async with self.get_db_engine().begin() as conn:
+            return [await conn.execute(statement) for statement in statements]
+
     def get_db_engine(self) -> sqlalchemy_asyncio.AsyncEngine:
         return self.db.get_engine()
 
+    def supports_returning(self) -> bool:
+        """Whether INSERT/UPDATE ... RETURNING is available, SQLite only has it since 3.35"""
+        dialect = self.get_db_engine().dialect
+        return dialect.insert_returning and dialect.update_returning
+
     def serialize_model(
         self, model: typing.Type[sqlalchemy.Base], data: sqlalchemy.Base, masked_columns: list[str] = []
     ) -> dict:
-        return {
-            column.name: getattr(data, column.name)
-            if not isinstance(getattr(data, column.name), (datetime.datetime))
-            else getattr(data, column.name).isoformat()
-            for column in model.__table__.columns
-            if column.name not in masked_columns
-        }
+        serialized = {}
+
+        for column_name in self._get_column_names(model):
+            if column_name in masked_columns:
+                continue
+
+            value = getattr(data, column_name)
+            serialized[column_name] = value.isoformat() if isinstance(value, datetime.datetime) else value
+
+        return serialized
+
+    def _get_column_names(self, model: typing.Type[sqlalchemy.Base]) -> tuple[str, ...]:
+        """Column names of a model, resolved once per model rather than per serialized row"""
+        column_names = self._column_names_cache.get(model)
+
+        if column_names is None:
+            column_names = tuple(column.name for column in model.__table__.columns)
+            self._column_names_cache[model] = column_names
+
+        return column_names
@@ -0,0 +1,25 @@
+import sqlalchemy
+from .. import migration
+
+
+@migration.migration_class(14)
+class DBMigrateLookupColumnIndexes(migration.DBMigration):
+    """Add indexes on foreign-key-like lookup columns"""
+
+    async def upgrade(self):
+        """Upgrade"""
+        # names follow SQLAlchemy's ix_<table>_<column> convention used by index=True on new databases
+        indexes = [
+            ('ix_knowledge_base_files_kb_id', 'knowledge_base_files', 'kb_id'),
+            ('ix_knowledge_base_chunks_file_id', 'knowledge_base_chunks', 'file_id'),
+            ('ix_bots_use_pipeline_uuid', 'bots', 'use_pipeline_uuid'),
+        ]
+
+        for index_name, table_name, column_name in indexes:
+            await self.ap.persistence_mgr.execute_async(
+                sqlalchemy.text(f'CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({column_name})')
+            )
+
+    async def downgrade(self):
+        """Downgrade"""
+        pass
@@ -0,0 +1,22 @@
+import sqlalchemy
+from .. import migration
+
+
+@migration.migration_class(15)
+class DBMigrateDescriptionTextColumns(migration.DBMigration):
+    """Widen description columns from VARCHAR(255) to TEXT"""
+
+    async def upgrade(self):
+        """Upgrade"""
+        # SQLite does not enforce VARCHAR lengths, only PostgreSQL needs the column type changed
+        if self.ap.persistence_mgr.db.name != 'postgresql':
+            return
+
+        for table_name in ['bots', 'llm_models', 'embedding_models', 'legacy_pipelines']:
+            await self.ap.persistence_mgr.execute_async(
+                sqlalchemy.text(f'ALTER TABLE {table_name} ALTER COLUMN description TYPE TEXT')
+            )
+
+    async def downgrade(self):
+        """Downgrade"""
+        pass
@@ -13,6 +13,16 @@ from . import filters
 importutil.import_modules_in_pkg(filters)
 
 
+PRE_INTERRUPT_LEVELS = frozenset({filter_entities.ResultLevel.BLOCK, filter_entities.ResultLevel.MASKED})
+"""前置阶段中会拦截消息的结果级别"""
+
+POST_REPLACE_LEVELS = frozenset({filter_entities.ResultLevel.PASS, filter_entities.ResultLevel.MASKED})
+"""后置阶段中以 replacement 改写回复的结果级别"""
+
+TEXT_COMPONENT_TYPES = frozenset({platform_message.Plain, platform_message.Source})
+"""前置过滤视为纯文本的消息组件类型"""
+
+
 @stage.stage_class('PostContentFilterStage')
 @stage.stage_class('PreContentFilterStage')
 class ContentFilterStage(stage.PipelineStage):
@@ -31,8 +41,12 @@ class ContentFilterStage(stage.PipelineStage):
 
     filter_chain: list[filter_model.ContentFilter]
 
+    stage_filters: dict[filter_entities.EnableStage, list[filter_model.ContentFilter]]
+    """各启用阶段对应的过滤器，初始化时按 enable_stages 预先分组"""
+
     def __init__(self, ap: app.Application):
         self.filter_chain = []
+        self.stage_filters = {stage: [] for stage in filter_entities.EnableStage}
         super().__init__(ap)
 
     async def initialize(self, pipeline_config: dict):
@@ -54,6 +68,9 @@ class ContentFilterStage(stage.PipelineStage):
         for filter in self.filter_chain:
             await filter.initialize()
 
+            for enable_stage in filter.enable_stages:
+                self.stage_filters[enable_stage].append(filter)
+
     async def _pre_process(
         self,
         message: str,
@@ -64,30 +81,32 @@ class ContentFilterStage(stage.PipelineStage):
         """
 
         if query.pipeline_config['safety']['content-filter']['scope'] == 'output-msg':
-            return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            return entities.StageProcessResult.model_construct(
+                result_type=entities.ResultType.CONTINUE, new_query=query
+            )
         if not message.strip():
-            return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            return entities.StageProcessResult.model_construct(
+                result_type=entities.ResultType.CONTINUE, new_query=query
+            )
         else:
-            for filter in self.filter_chain:
-                if filter_entities.EnableStage.PRE in filter.enable_stages:
-                    result = await filter.process(query, message)
-
-                    if result.level in [
-                        filter_entities.ResultLevel.BLOCK,
-                        filter_entities.ResultLevel.MASKED,
-                    ]:
-                        return entities.StageProcessResult(
-                            result_type=entities.ResultType.INTERRUPT,
-                            new_query=query,
-                            user_notice=result.user_notice,
-                            console_notice=result.console_notice,
-                        )
-                    elif result.level == filter_entities.ResultLevel.PASS:  # 传到下一个
-                        message = result.replacement
+            for filter in self.stage_filters[filter_entities.EnableStage.PRE]:
+                result = await filter.process(query, message)
+
+                if result.level in PRE_INTERRUPT_LEVELS:
+                    return entities.StageProcessResult(
+                        result_type=entities.ResultType.INTERRUPT,
+                        new_query=query,
+                        user_notice=result.user_notice,
+                        console_notice=result.console_notice,
+                    )
+                elif result.level == filter_entities.ResultLevel.PASS:  # 传到下一个
+                    message = result.replacement
 
             query.message_chain = platform_message.MessageChain([platform_message.Plain(text=message)])
 
-            return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            return entities.StageProcessResult.model_construct(
+                result_type=entities.ResultType.CONTINUE, new_query=query
+            )
 
     async def _post_process(
         self,
@@ -98,45 +117,45 @@ class ContentFilterStage(stage.PipelineStage):
         只要是 PASS 或者 MASKED 的就通过此 filter，将其 replacement 设置为message，进入下一个 filter
         """
         if query.pipeline_config['safety']['content-filter']['scope'] == 'income-msg':
-            return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            return entities.StageProcessResult.model_construct(
+                result_type=entities.ResultType.CONTINUE, new_query=query
+            )
         else:
             message = message.strip()
-            for filter in self.filter_chain:
-                if filter_entities.EnableStage.POST in filter.enable_stages:
-                    result = await filter.process(query, message)
-
-                    if result.level == filter_entities.ResultLevel.BLOCK:
-                        return entities.StageProcessResult(
-                            result_type=entities.ResultType.INTERRUPT,
-                            new_query=query,
-                            user_notice=result.user_notice,
-                            console_notice=result.console_notice,
-                        )
-                    elif result.level in [
-                        filter_entities.ResultLevel.PASS,
-                        filter_entities.ResultLevel.MASKED,
-                    ]:
-                        message = result.replacement
+            for filter in self.stage_filters[filter_entities.EnableStage.POST]:
+                result = await filter.process(query, message)
+
+                if result.level == filter_entities.ResultLevel.BLOCK:
+                    return entities.StageProcessResult(
+                        result_type=entities.ResultType.INTERRUPT,
+                        new_query=query,
+                        user_notice=result.user_notice,
+                        console_notice=result.console_notice,
+                    )
+                elif result.level in POST_REPLACE_LEVELS:
+                    message = result.replacement
 
             query.resp_messages[-1].content = message
 
-            return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            return entities.StageProcessResult.model_construct(
+                result_type=entities.ResultType.CONTINUE, new_query=query
+            )
 
     async def process(self, query: pipeline_query.Query, stage_inst_name: str) -> entities.StageProcessResult:
         """处理"""
         if stage_inst_name == 'PreContentFilterStage':
             contain_non_text = False
 
-            text_components = [platform_message.Plain, platform_message.Source]
-
             for me in query.message_chain:
-                if type(me) not in text_components:
+                if type(me) not in TEXT_COMPONENT_TYPES:
                     contain_non_text = True
                     break
 
             if contain_non_text:
                 self.ap.logger.debug('消息中包含非文本消息，跳过内容过滤器检查。')
-                return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                return entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.CONTINUE, new_query=query
+                )
 
             return await self._pre_process(str(query.message_chain).strip(), query)
         elif stage_inst_name == 'PostContentFilterStage':
@@ -149,6 +168,8 @@ class ContentFilterStage(stage.PipelineStage):
                 self.ap.logger.debug(
                     'resp_messages[-1] 不是 Message 类型或 query.resp_messages[-1].content 不是 str 类型，跳过内容过滤器检查。'
                 )
-                return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                return entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.CONTINUE, new_query=query
+                )
         else:
             raise ValueError(f'未知的 stage_inst_name: {stage_inst_name}')
@@ -62,6 +62,8 @@ class ManagerResultLevel(enum.Enum):
 
 
 class FilterManagerResult(pydantic.BaseModel):
+    model_config = pydantic.ConfigDict(defer_build=True)
+
     level: ManagerResultLevel
 
     replacement: str
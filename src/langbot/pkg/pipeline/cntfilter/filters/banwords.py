@@ -10,26 +10,29 @@ import langbot_plugin.api.entities.builtin.pipeline.query as pipeline_query
 class BanWordFilter(filter_model.ContentFilter):
     """Filter content"""
 
+    patterns: list[re.Pattern]
+    """Compiled sensitive word patterns"""
+
     async def initialize(self):
-        pass
+        # the word list is fixed after boot and usually longer than re's internal pattern cache,
+        # so compile each word once instead of letting every message recompile them
+        self.patterns = [re.compile(word) for word in self.ap.sensitive_meta.data['words']]
 
     async def process(self, query: pipeline_query.Query, message: str) -> entities.FilterResult:
         found = False
 
-        for word in self.ap.sensitive_meta.data['words']:
-            match = re.findall(word, message)
+        mask = self.ap.sensitive_meta.data['mask']
+        mask_word = self.ap.sensitive_meta.data['mask_word']
 
-            if len(match) > 0:
-                found = True
+        def repl(match: re.Match) -> str:
+            return mask_word if mask_word != '' else mask * len(match.group(0))
 
-                for i in range(len(match)):
-                    if self.ap.sensitive_meta.data['mask_word'] == '':
-                        message = message.replace(
-                            match[i],
-                            self.ap.sensitive_meta.data['mask'] * len(match[i]),
-                        )
-                    else:
-                        message = message.replace(match[i], self.ap.sensitive_meta.data['mask_word'])
+        # 每个模式只扫描一次消息，直接替换命中位置，不再 findall 后逐个 str.replace 全文
+        for pattern in self.patterns:
+            message, count = pattern.subn(repl, message)
+
+            if count > 0:
+                found = True
 
         return entities.FilterResult(
             level=entities.ResultLevel.MASKED if found else entities.ResultLevel.PASS,
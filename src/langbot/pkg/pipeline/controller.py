@@ -26,26 +26,39 @@ class Controller:
         try:
             while True:
                 selected_query: pipeline_query.Query = None
+                selected_index = -1
 
                 # 取请求
                 async with self.ap.query_pool:
                     queries: list[pipeline_query.Query] = self.ap.query_pool.queries
 
-                    for query in queries:
+                    # sessions found saturated in this scan, they can't be released while we hold the pool lock,
+                    # so later queued queries of the same session are skipped without looking the session up again
+                    busy_sessions: set[tuple] = set()
+
+                    for index, query in enumerate(queries):
+                        session_key = (query.launcher_type, query.launcher_id)
+                        if session_key in busy_sessions:
+                            continue
+
                         session = await self.ap.sess_mgr.get_session(query)
                         # Debug logging removed from tight loop to prevent excessive log generation
                         # that can cause memory overflow in high-traffic scenarios
 
                         if not session._semaphore.locked():
                             selected_query = query
+                            selected_index = index
                             await session._semaphore.acquire()
                             # Only log when actually selecting a query
                             self.ap.logger.debug(f'Selected query {query.query_id} for processing')
 
                             break
 
+                        busy_sessions.add(session_key)
+
                     if selected_query:  # 找到了
-                        queries.remove(selected_query)
+                        # 按扫描时记录的位置直接删除，不再用 remove 逐个比较前面排队的 query
+                        del queries[selected_index]
                     else:  # 没找到 说明：没有请求 或者 所有query对应的session都已达到并发上限
                         await self.ap.query_pool.condition.wait()
                         continue
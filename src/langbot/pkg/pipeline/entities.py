@@ -17,19 +17,40 @@ class ResultType(enum.Enum):
     """中断流水线"""
 
 
+def _user_notice_tag(value: typing.Any) -> str:
+    """按值的类型直接确定 user_notice 所属的联合分支，避免逐个尝试"""
+    if value is None:
+        return 'none'
+    if isinstance(value, str):
+        return 'str'
+    if isinstance(value, platform_message.MessageChain):
+        return 'chain'
+    return 'components'
+
+
+UserNotice = typing.Annotated[
+    typing.Union[
+        typing.Annotated[str, pydantic.Tag('str')],
+        typing.Annotated[list[platform_message.MessageComponent], pydantic.Tag('components')],
+        typing.Annotated[platform_message.MessageChain, pydantic.Tag('chain')],
+        typing.Annotated[None, pydantic.Tag('none')],
+    ],
+    pydantic.Discriminator(_user_notice_tag),
+]
+
+
 class StageProcessResult(pydantic.BaseModel):
+    """阶段处理结果
+
+    仅携带 result_type 和 new_query 的结果由阶段内部以 model_construct 构造，跳过校验；
+    user_notice 的各种形式由流水线在发送前统一转换为 MessageChain。
+    """
+
     result_type: ResultType
 
     new_query: pipeline_query.Query
 
-    user_notice: typing.Optional[
-        typing.Union[
-            str,
-            list[platform_message.MessageComponent],
-            platform_message.MessageChain,
-            None,
-        ]
-    ] = []
+    user_notice: UserNotice = []
     """只要设置了就会发送给用户"""
 
     console_notice: typing.Optional[str] = ''
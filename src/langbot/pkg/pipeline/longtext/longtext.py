@@ -74,7 +74,9 @@ class LongTextProcessStage(stage.PipelineStage):
     async def process(self, query: pipeline_query.Query, stage_inst_name: str) -> entities.StageProcessResult:
         if self.strategy_impl is None:
             self.ap.logger.debug('Long message processing strategy is not set, skip long message processing.')
-            return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            return entities.StageProcessResult.model_construct(
+                result_type=entities.ResultType.CONTINUE, new_query=query
+            )
 
         # 检查是否包含非 Plain 组件
         contains_non_plain = False
@@ -94,4 +96,4 @@ class LongTextProcessStage(stage.PipelineStage):
                 await self.strategy_impl.process(str(query.resp_message_chain[-1]), query)
             )
 
-        return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+        return entities.StageProcessResult.model_construct(result_type=entities.ResultType.CONTINUE, new_query=query)
@@ -28,13 +28,16 @@ class Text2ImageStrategy(strategy_model.LongTextStrategy):
         )
 
     async def process(self, message: str, query: pipeline_query.Query) -> list[platform_message.MessageComponent]:
+        # 原图与压缩图共用同一时间戳
+        timestamp = int(time.time())
+
         img_path = self.text_to_image(
             text_str=message,
-            save_as='temp/{}.png'.format(int(time.time())),
+            save_as='temp/{}.png'.format(timestamp),
             query=query,
         )
 
-        compressed_path, size = self.compress_image(img_path, outfile='temp/{}_compressed.png'.format(int(time.time())))
+        compressed_path, size = self.compress_image(img_path, outfile='temp/{}_compressed.png'.format(timestamp))
 
         with open(compressed_path, 'rb') as f:
             img = f.read()
@@ -143,12 +146,12 @@ class Text2ImageStrategy(strategy_model.LongTextStrategy):
 
         text_width = width - 80
 
+        font = self.get_font(query.pipeline_config['output']['long-text-processing']['font-path'])
+
         self.ap.logger.debug('lines: {}, text_width: {}'.format(lines, text_width))
         for line in lines:
             # 如果长了就分割
-            line_width = self.get_font(query.pipeline_config['output']['long-text-processing']['font-path']).getlength(
-                line
-            )
+            line_width = font.getlength(line)
             self.ap.logger.debug('line_width: {}'.format(line_width))
             if line_width < text_width:
                 final_lines.append(line)
@@ -169,9 +172,7 @@ class Text2ImageStrategy(strategy_model.LongTextStrategy):
 
                     final_lines.append(rest_text[:point])
                     rest_text = rest_text[point:]
-                    line_width = self.get_font(
-                        query.pipeline_config['output']['long-text-processing']['font-path']
-                    ).getlength(rest_text)
+                    line_width = font.getlength(rest_text)
                     if line_width < text_width:
                         final_lines.append(rest_text)
                         break
@@ -191,17 +192,8 @@ class Text2ImageStrategy(strategy_model.LongTextStrategy):
                 (offset_x, offset_y + 35 * line_number),
                 final_line,
                 fill=(0, 0, 0),
-                font=self.get_font(query.pipeline_config['output']['long-text-processing']['font-path']),
+                font=font,
             )
-            # 遍历此行,检查是否有emoji
-            idx_in_line = 0
-            for ch in final_line:
-                # 检查字符占位宽
-                char_code = ord(ch)
-                if char_code >= 127:
-                    idx_in_line += 1
-                else:
-                    idx_in_line += 0.5
 
             line_number += 1
 
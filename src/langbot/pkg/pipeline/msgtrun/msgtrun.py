@@ -32,4 +32,4 @@ class ConversationMessageTruncator(stage.PipelineStage):
         """处理"""
         query = await self.trun.truncate(query)
 
-        return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+        return entities.StageProcessResult.model_construct(result_type=entities.ResultType.CONTINUE, new_query=query)
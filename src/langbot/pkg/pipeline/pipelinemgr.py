@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import typing
 import traceback
 
@@ -179,6 +180,9 @@ class RuntimePipeline:
         """
         i = stage_index
 
+        # formatting the ResultType enum into the per-stage debug lines is the costly part, skip it unless shown
+        debug_enabled = self.ap.logger.isEnabledFor(logging.DEBUG)
+
         while i < len(self.stage_containers):
             stage_container = self.stage_containers[i]
 
@@ -190,27 +194,34 @@ class RuntimePipeline:
                 result = await result
 
             if isinstance(result, pipeline_entities.StageProcessResult):  # 直接返回结果
-                self.ap.logger.debug(
-                    f'Stage {stage_container.inst_name} processed query {query.query_id} res {result.result_type}'
-                )
+                if debug_enabled:
+                    self.ap.logger.debug(
+                        f'Stage {stage_container.inst_name} processed query {query.query_id} res {result.result_type}'
+                    )
                 await self._check_output(query, result)
 
                 if result.result_type == pipeline_entities.ResultType.INTERRUPT:
-                    self.ap.logger.debug(f'Stage {stage_container.inst_name} interrupted query {query.query_id}')
+                    if debug_enabled:
+                        self.ap.logger.debug(f'Stage {stage_container.inst_name} interrupted query {query.query_id}')
                     break
                 elif result.result_type == pipeline_entities.ResultType.CONTINUE:
                     query = result.new_query
             elif isinstance(result, typing.AsyncGenerator):  # 生成器
-                self.ap.logger.debug(f'Stage {stage_container.inst_name} processed query {query.query_id} gen')
+                if debug_enabled:
+                    self.ap.logger.debug(f'Stage {stage_container.inst_name} processed query {query.query_id} gen')
 
                 async for sub_result in result:
-                    self.ap.logger.debug(
-                        f'Stage {stage_container.inst_name} processed query {query.query_id} res {sub_result.result_type}'
-                    )
+                    if debug_enabled:
+                        self.ap.logger.debug(
+                            f'Stage {stage_container.inst_name} processed query {query.query_id} res {sub_result.result_type}'
+                        )
                     await self._check_output(query, sub_result)
 
                     if sub_result.result_type == pipeline_entities.ResultType.INTERRUPT:
-                        self.ap.logger.debug(f'Stage {stage_container.inst_name} interrupted query {query.query_id}')
+                        if debug_enabled:
+                            self.ap.logger.debug(
+                                f'Stage {stage_container.inst_name} interrupted query {query.query_id}'
+                            )
                         break
                     elif sub_result.result_type == pipeline_entities.ResultType.CONTINUE:
                         query = sub_result.new_query
@@ -267,11 +278,15 @@ class PipelineManager:
 
     pipelines: list[RuntimePipeline]
 
+    pipeline_index: dict[str, RuntimePipeline]
+    """uuid 到运行时流水线的索引，每条消息都要按 uuid 查找流水线"""
+
     stage_dict: dict[str, type[stage.PipelineStage]]
 
     def __init__(self, ap: app.Application):
         self.ap = ap
         self.pipelines = []
+        self.pipeline_index = {}
 
     async def initialize(self):
         self.stage_dict = {name: cls for name, cls in stage.preregistered_stages.items()}
@@ -310,15 +325,14 @@ class PipelineManager:
 
         runtime_pipeline = RuntimePipeline(self.ap, pipeline_entity, stage_containers)
         self.pipelines.append(runtime_pipeline)
+        self.pipeline_index[pipeline_entity.uuid] = runtime_pipeline
 
     async def get_pipeline_by_uuid(self, uuid: str) -> RuntimePipeline | None:
-        for pipeline in self.pipelines:
-            if pipeline.pipeline_entity.uuid == uuid:
-                return pipeline
-        return None
+        return self.pipeline_index.get(uuid)
 
     async def remove_pipeline(self, uuid: str):
-        for pipeline in self.pipelines:
-            if pipeline.pipeline_entity.uuid == uuid:
-                self.pipelines.remove(pipeline)
-                return
+        pipeline = self.pipeline_index.pop(uuid, None)
+        if pipeline is not None:
+            self.pipelines.remove(pipeline)
+            for stage_container in pipeline.stage_containers:
+                await stage_container.inst.dispose()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import datetime
+import time
 
 from .. import stage, entities
 from langbot_plugin.api.entities.builtin.provider import message as provider_message
@@ -76,24 +76,24 @@ class PreProcessor(stage.PipelineStage):
                 self.ap.logger.debug(f'Use funcs: {query.use_funcs}')
 
         sender_name = ''
+        group_name = ''
 
         if isinstance(query.message_event, platform_events.GroupMessage):
             sender_name = query.message_event.sender.member_name
+            group_name = query.message_event.group.name
         elif isinstance(query.message_event, platform_events.FriendMessage):
             sender_name = query.message_event.sender.nickname
 
+        msg_time = query.message_event.time
+
         variables = {
             'launcher_type': query.session.launcher_type.value,
             'launcher_id': query.session.launcher_id,
             'sender_id': query.sender_id,
             'session_id': f'{query.session.launcher_type.value}_{query.session.launcher_id}',
             'conversation_id': conversation.uuid,
-            'msg_create_time': (
-                int(query.message_event.time) if query.message_event.time else int(datetime.datetime.now().timestamp())
-            ),
-            'group_name': query.message_event.group.name
-            if isinstance(query.message_event, platform_events.GroupMessage)
-            else '',
+            'msg_create_time': int(msg_time) if msg_time else int(time.time()),
+            'group_name': group_name,
             'sender_name': sender_name,
         }
         query.variables.update(variables)
@@ -165,4 +165,4 @@ class PreProcessor(stage.PipelineStage):
         query.prompt.messages = event_ctx.event.default_prompt
         query.messages = event_ctx.event.prompt
 
-        return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+        return entities.StageProcessResult.model_construct(result_type=entities.ResultType.CONTINUE, new_query=query)
@@ -16,6 +16,9 @@ class MessageHandler(metaclass=abc.ABCMeta):
     async def initialize(self):
         pass
 
+    async def dispose(self):
+        pass
+
     @abc.abstractmethod
     async def handle(
         self,
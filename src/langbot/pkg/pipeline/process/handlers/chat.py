@@ -21,6 +21,40 @@ importutil.import_modules_in_pkg(runners)
 
 
 class ChatMessageHandler(handler.MessageHandler):
+    runner: runner_module.RequestRunner | None = None
+    """本流水线使用的请求运行器，首次处理消息时创建，之后的消息复用"""
+
+    _disposed: bool = False
+    """所属流水线已被移除"""
+
+    def _create_runner(self, pipeline_config: dict) -> runner_module.RequestRunner:
+        runner_name = pipeline_config['ai']['runner']['runner']
+        for r in runner_module.preregistered_runners:
+            if r.name == runner_name:
+                return r(self.ap, pipeline_config)
+
+        raise ValueError(f'Request Runner not found: {runner_name}')
+
+    def _get_runner(self, pipeline_config: dict) -> runner_module.RequestRunner:
+        """获取请求运行器
+
+        处理器随流水线一同创建，流水线配置变更时会重新加载，因此运行器可以在整个流水线生命周期内复用。
+        流水线移除后仍在处理的请求不再缓存运行器，每次创建临时运行器，由调用方用完后释放。
+        """
+        if self._disposed:
+            return self._create_runner(pipeline_config)
+
+        if self.runner is None:
+            self.runner = self._create_runner(pipeline_config)
+
+        return self.runner
+
+    async def dispose(self):
+        self._disposed = True
+        if self.runner is not None:
+            await self.runner.dispose()
+            self.runner = None
+
     async def handle(
         self,
         query: pipeline_query.Query,
@@ -57,9 +91,13 @@ class ChatMessageHandler(handler.MessageHandler):
                 mc = event_ctx.event.reply_message_chain
                 query.resp_messages.append(mc)
 
-                yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                yield entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.CONTINUE, new_query=query
+                )
             else:
-                yield entities.StageProcessResult(result_type=entities.ResultType.INTERRUPT, new_query=query)
+                yield entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.INTERRUPT, new_query=query
+                )
         else:
             if event_ctx.event.user_message_alter is not None:
                 if isinstance(event_ctx.event.user_message_alter, list):
@@ -77,26 +115,25 @@ class ChatMessageHandler(handler.MessageHandler):
             except AttributeError:
                 is_stream = False
 
+            runner = None
             try:
-                for r in runner_module.preregistered_runners:
-                    if r.name == query.pipeline_config['ai']['runner']['runner']:
-                        runner = r(self.ap, query.pipeline_config)
-                        break
-                else:
-                    raise ValueError(f'Request Runner not found: {query.pipeline_config["ai"]["runner"]["runner"]}')
+                runner = self._get_runner(query.pipeline_config)
+                # 流水线移除后拿到的是未缓存的临时运行器
+                temporary_runner = runner is not self.runner
                 if is_stream:
-                    resp_message_id = uuid.uuid4()
+                    # 整个流式回复共用一个 id，只格式化一次
+                    resp_message_id = str(uuid.uuid4())
                     chunk_count = 0  # Track streaming chunks to reduce excessive logging
 
                     async for result in runner.run(query):
-                        result.resp_message_id = str(resp_message_id)
+                        result.resp_message_id = resp_message_id
                         if query.resp_messages:
                             query.resp_messages.pop()
                         if query.resp_message_chain:
                             query.resp_message_chain.pop()
                         # 此时连接外部 AI 服务正常,创建卡片
                         if not is_create_card:  # 只有不是第一次才创建卡片
-                            await query.adapter.create_message_card(str(resp_message_id), query.message_event)
+                            await query.adapter.create_message_card(resp_message_id, query.message_event)
                             is_create_card = True
                         query.resp_messages.append(result)
 
@@ -116,7 +153,9 @@ class ChatMessageHandler(handler.MessageHandler):
                         if result.content is not None:
                             text_length += len(result.content)
 
-                        yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                        yield entities.StageProcessResult.model_construct(
+                            result_type=entities.ResultType.CONTINUE, new_query=query
+                        )
 
                     # Log final summary after streaming completes
                     self.ap.logger.info(
@@ -134,7 +173,9 @@ class ChatMessageHandler(handler.MessageHandler):
                         if result.content is not None:
                             text_length += len(result.content)
 
-                        yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                        yield entities.StageProcessResult.model_construct(
+                            result_type=entities.ResultType.CONTINUE, new_query=query
+                        )
 
                 query.session.using_conversation.messages.append(query.user_message)
 
@@ -154,4 +195,6 @@ class ChatMessageHandler(handler.MessageHandler):
                 )
             finally:
                 # TODO statistics
-                pass
+                # 临时运行器不会被 dispose 释放，请求结束后在此释放
+                if runner is not None and temporary_runner:
+                    await runner.dispose()
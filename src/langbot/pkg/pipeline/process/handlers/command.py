@@ -55,9 +55,13 @@ class CommandHandler(handler.MessageHandler):
 
                 query.resp_messages.append(mc)
 
-                yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                yield entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.CONTINUE, new_query=query
+                )
             else:
-                yield entities.StageProcessResult(result_type=entities.ResultType.INTERRUPT, new_query=query)
+                yield entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.INTERRUPT, new_query=query
+                )
 
         else:
             session = await self.ap.sess_mgr.get_session(query)
@@ -75,7 +79,9 @@ class CommandHandler(handler.MessageHandler):
 
                     self.ap.logger.info(f'Command({query.query_id}) error: {self.cut_str(str(ret.error))}')
 
-                    yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                    yield entities.StageProcessResult.model_construct(
+                        result_type=entities.ResultType.CONTINUE, new_query=query
+                    )
                 elif (
                     ret.text is not None
                     or ret.image_url is not None
@@ -105,6 +111,10 @@ class CommandHandler(handler.MessageHandler):
 
                     self.ap.logger.info(f'Command returned: {self.cut_str(str(content[0]))}')
 
-                    yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                    yield entities.StageProcessResult.model_construct(
+                        result_type=entities.ResultType.CONTINUE, new_query=query
+                    )
                 else:
-                    yield entities.StageProcessResult(result_type=entities.ResultType.INTERRUPT, new_query=query)
+                    yield entities.StageProcessResult.model_construct(
+                        result_type=entities.ResultType.INTERRUPT, new_query=query
+                    )
@@ -28,6 +28,10 @@ class Processor(stage.PipelineStage):
         await self.cmd_handler.initialize()
         await self.chat_handler.initialize()
 
+    async def dispose(self):
+        await self.cmd_handler.dispose()
+        await self.chat_handler.dispose()
+
     async def process(
         self,
         query: pipeline_query.Query,
@@ -44,7 +48,8 @@ class Processor(stage.PipelineStage):
             cmd_prefix = self.ap.instance_config.data['command']['prefix']
             cmd_enable = self.ap.instance_config.data['command'].get('enable', True)
 
-            if cmd_enable and any(message_text.startswith(prefix) for prefix in cmd_prefix):
+            # str.startswith 接受元组，一次调用检查全部前缀
+            if cmd_enable and message_text.startswith(tuple(cmd_prefix)):
                 handler_to_use = self.cmd_handler
             else:
                 handler_to_use = self.chat_handler
@@ -6,16 +6,26 @@ from .. import algo
 import langbot_plugin.api.entities.builtin.pipeline.query as pipeline_query
 
 
+SWEEP_INTERVAL = 60
+"""清理过期容器的最小间隔（秒）"""
+
+
 # 固定窗口算法
 class SessionContainer:
+    __slots__ = ('wait_lock', 'records', 'expires_at')
+
     wait_lock: asyncio.Lock
 
     records: dict[int, int]
     """访问记录，key为每窗口长度的起始时间戳，value为访问次数"""
 
+    expires_at: float
+    """当前窗口的结束时间戳，过期后容器中的记录不再有效，可被回收"""
+
     def __init__(self):
         self.wait_lock = asyncio.Lock()
         self.records = {}
+        self.expires_at = time.time() + SWEEP_INTERVAL
 
 
 @algo.algo_class('fixwin')
@@ -26,9 +36,26 @@ class FixedWindowAlgo(algo.ReteLimitAlgo):
     containers: dict[str, SessionContainer]
     """访问记录容器，key为launcher_type launcher_id"""
 
+    last_sweep: float
+    """上次清理过期容器的时间戳"""
+
     async def initialize(self):
         self.containers_lock = asyncio.Lock()
         self.containers = {}
+        self.last_sweep = time.time()
+
+    def _sweep_expired_containers(self, now: float):
+        """回收窗口已过期且无人等待的容器，避免容器随会话数量无限增长"""
+        expired = [
+            session_name
+            for session_name, container in self.containers.items()
+            if container.expires_at <= now and not container.wait_lock.locked()
+        ]
+
+        for session_name in expired:
+            del self.containers[session_name]
+
+        self.last_sweep = now
 
     async def require_access(
         self,
@@ -42,6 +69,10 @@ class FixedWindowAlgo(algo.ReteLimitAlgo):
         session_name = f'{launcher_type}_{launcher_id}'
 
         async with self.containers_lock:
+            now = time.time()
+            if now - self.last_sweep >= SWEEP_INTERVAL:
+                self._sweep_expired_containers(now)
+
             container = self.containers.get(session_name)
 
             if container is None:
@@ -86,6 +117,8 @@ class FixedWindowAlgo(algo.ReteLimitAlgo):
                 # 访问次数加一
                 container.records[now] = count + 1
 
+            container.expires_at = now + window_size
+
             # 返回True
             return True
 
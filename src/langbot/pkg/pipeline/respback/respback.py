@@ -55,4 +55,4 @@ class SendResponseBackStage(stage.PipelineStage):
                 quote_origin=quote_origin,
             )
 
-        return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+        return entities.StageProcessResult.model_construct(result_type=entities.ResultType.CONTINUE, new_query=query)
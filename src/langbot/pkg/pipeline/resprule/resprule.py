@@ -35,7 +35,9 @@ class GroupRespondRuleCheckStage(stage.PipelineStage):
 
     async def process(self, query: pipeline_query.Query, stage_inst_name: str) -> entities.StageProcessResult:
         if query.launcher_type.value != 'group':  # 只处理群消息
-            return entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            return entities.StageProcessResult.model_construct(
+                result_type=entities.ResultType.CONTINUE, new_query=query
+            )
 
         rules = query.pipeline_config['trigger']['group-respond-rules']
 
@@ -55,4 +57,4 @@ class GroupRespondRuleCheckStage(stage.PipelineStage):
                     new_query=query,
                 )
 
-        return entities.StageProcessResult(result_type=entities.ResultType.INTERRUPT, new_query=query)
+        return entities.StageProcessResult.model_construct(result_type=entities.ResultType.INTERRUPT, new_query=query)
@@ -42,3 +42,7 @@ class PipelineStage(metaclass=abc.ABCMeta):
     ]:
         """处理"""
         raise NotImplementedError
+
+    async def dispose(self):
+        """释放阶段持有的资源，流水线移除或重载时调用"""
+        pass
@@ -34,7 +34,7 @@ class ResponseWrapper(stage.PipelineStage):
         if isinstance(query.resp_messages[-1], platform_message.MessageChain):
             query.resp_message_chain.append(query.resp_messages[-1])
 
-            yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+            yield entities.StageProcessResult.model_construct(result_type=entities.ResultType.CONTINUE, new_query=query)
 
         else:
             if query.resp_messages[-1].role == 'command':
@@ -42,11 +42,15 @@ class ResponseWrapper(stage.PipelineStage):
                     query.resp_messages[-1].get_content_platform_message_chain(prefix_text='[bot] ')
                 )
 
-                yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                yield entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.CONTINUE, new_query=query
+                )
             elif query.resp_messages[-1].role == 'plugin':
                 query.resp_message_chain.append(query.resp_messages[-1].get_content_platform_message_chain())
 
-                yield entities.StageProcessResult(result_type=entities.ResultType.CONTINUE, new_query=query)
+                yield entities.StageProcessResult.model_construct(
+                    result_type=entities.ResultType.CONTINUE, new_query=query
+                )
             else:
                 if query.resp_messages[-1].role == 'assistant':
                     result = query.resp_messages[-1]
@@ -52,6 +52,9 @@ class RuntimeBot:
         self.logger = logger
 
     async def initialize(self):
+        # the listeners below are only registered on self.adapter, so its class name is fixed for this bot
+        adapter_name = self.adapter.__class__.__name__
+
         async def on_friend_message(
             event: platform_events.FriendMessage,
             adapter: abstract_platform_adapter.AbstractMessagePlatformAdapter,
@@ -68,9 +71,9 @@ class RuntimeBot:
 
             # Push to webhooks and check if pipeline should be skipped
             skip_pipeline = False
-            if hasattr(self.ap, 'webhook_pusher') and self.ap.webhook_pusher:
+            if self.ap.webhook_pusher:
                 skip_pipeline = await self.ap.webhook_pusher.push_person_message(
-                    event, self.bot_entity.uuid, adapter.__class__.__name__
+                    event, self.bot_entity.uuid, adapter_name
                 )
 
             # Only add to query pool if no webhook requested to skip pipeline
@@ -104,9 +107,9 @@ class RuntimeBot:
 
             # Push to webhooks and check if pipeline should be skipped
             skip_pipeline = False
-            if hasattr(self.ap, 'webhook_pusher') and self.ap.webhook_pusher:
+            if self.ap.webhook_pusher:
                 skip_pipeline = await self.ap.webhook_pusher.push_group_message(
-                    event, self.bot_entity.uuid, adapter.__class__.__name__
+                    event, self.bot_entity.uuid, adapter_name
                 )
 
             # Only add to query pool if no webhook requested to skip pipeline
@@ -164,32 +167,42 @@ class PlatformManager:
     # ====== 4.0 ======
     ap: app.Application = None
 
-    bots: list[RuntimeBot]
+    bots: dict[str, RuntimeBot]
+    """bot uuid 到运行时机器人的映射，按加载顺序排列"""
 
     websocket_proxy_bot: RuntimeBot
 
     adapter_components: list[engine.Component]
 
     adapter_dict: dict[str, type[abstract_platform_adapter.AbstractMessagePlatformAdapter]]
+    """Adapter classes keyed by name, imported on first use by get_adapter_class"""
+
+    adapter_infos: dict[str, dict]
+    """Plain dicts of adapter manifests keyed by name, rendered once at initialization"""
+
+    adapter_component_dict: dict[str, engine.Component]
+    """Adapter components keyed by name"""
 
     def __init__(self, ap: app.Application = None):
         self.ap = ap
-        self.bots = []
+        self.bots = {}
         self.adapter_components = []
         self.adapter_dict = {}
+        self.adapter_infos = {}
+        self.adapter_component_dict = {}
 
     async def initialize(self):
         # delete all bot log images
         await self.ap.storage_mgr.storage_provider.delete_dir_recursive('bot_log_images')
 
         self.adapter_components = self.ap.discover.get_components_by_kind('MessagePlatformAdapter')
-        adapter_dict: dict[str, type[abstract_platform_adapter.AbstractMessagePlatformAdapter]] = {}
-        for component in self.adapter_components:
-            adapter_dict[component.metadata.name] = component.get_python_component_class()
-        self.adapter_dict = adapter_dict
+        self.adapter_infos = {
+            component.metadata.name: component.to_plain_dict() for component in self.adapter_components
+        }
+        self.adapter_component_dict = {component.metadata.name: component for component in self.adapter_components}
 
         # initialize websocket adapter
-        websocket_adapter_class = self.adapter_dict['websocket']
+        websocket_adapter_class = self.get_adapter_class('websocket')
         websocket_logger = EventLogger(name='websocket-adapter', ap=self.ap)
         websocket_adapter_inst = websocket_adapter_class(
             {},
@@ -214,13 +227,24 @@ class PlatformManager:
 
         await self.load_bots_from_db()
 
+    def get_adapter_class(self, name: str) -> type[abstract_platform_adapter.AbstractMessagePlatformAdapter] | None:
+        """Get an adapter class, importing its module on first use"""
+        adapter_class = self.adapter_dict.get(name)
+        if adapter_class is None:
+            component = self.adapter_component_dict.get(name)
+            if component is None:
+                return None
+            adapter_class = component.get_python_component_class()
+            self.adapter_dict[name] = adapter_class
+        return adapter_class
+
     def get_running_adapters(self) -> list[abstract_platform_adapter.AbstractMessagePlatformAdapter]:
-        return [bot.adapter for bot in self.bots if bot.enable]
+        return [bot.adapter for bot in self.bots.values() if bot.enable]
 
     async def load_bots_from_db(self):
         self.ap.logger.info('Loading bots from db...')
 
-        self.bots = []
+        self.bots = {}
 
         result = await self.ap.persistence_mgr.execute_async(sqlalchemy.select(persistence_bot.Bot))
 
@@ -247,10 +271,11 @@ class PlatformManager:
 
         logger = EventLogger(name=f'platform-adapter-{bot_entity.name}', ap=self.ap)
 
-        if bot_entity.adapter not in self.adapter_dict:
+        adapter_class = self.get_adapter_class(bot_entity.adapter)
+        if adapter_class is None:
             raise platform_errors.AdapterNotFoundError(bot_entity.adapter)
 
-        adapter_inst = self.adapter_dict[bot_entity.adapter](
+        adapter_inst = adapter_class(
             bot_entity.adapter_config,
             logger,
         )
@@ -263,51 +288,37 @@ class PlatformManager:
 
         await runtime_bot.initialize()
 
-        self.bots.append(runtime_bot)
+        self.bots[bot_entity.uuid] = runtime_bot
 
         return runtime_bot
 
     async def get_bot_by_uuid(self, bot_uuid: str) -> RuntimeBot | None:
-        for bot in self.bots:
-            if bot.bot_entity.uuid == bot_uuid:
-                return bot
-        return None
+        return self.bots.get(bot_uuid)
 
     async def remove_bot(self, bot_uuid: str):
-        for bot in self.bots:
-            if bot.bot_entity.uuid == bot_uuid:
-                if bot.enable:
-                    await bot.shutdown()
-                self.bots.remove(bot)
-                return
+        bot = self.bots.pop(bot_uuid, None)
+        if bot is not None and bot.enable:
+            await bot.shutdown()
 
     def get_available_adapters_info(self) -> list[dict]:
-        return [
-            component.to_plain_dict() for component in self.adapter_components if component.metadata.name != 'websocket'
-        ]
+        return [info for name, info in self.adapter_infos.items() if name != 'websocket']
 
     def get_available_adapter_info_by_name(self, name: str) -> dict | None:
-        for component in self.adapter_components:
-            if component.metadata.name == name:
-                return component.to_plain_dict()
-        return None
+        return self.adapter_infos.get(name)
 
     def get_available_adapter_manifest_by_name(self, name: str) -> engine.Component | None:
-        for component in self.adapter_components:
-            if component.metadata.name == name:
-                return component
-        return None
+        return self.adapter_component_dict.get(name)
 
     async def run(self):
         # This method will only be called when the application launching
         await self.websocket_proxy_bot.run()
 
-        for bot in self.bots:
+        for bot in self.bots.values():
             if bot.enable:
                 await bot.run()
 
     async def shutdown(self):
-        for bot in self.bots:
+        for bot in self.bots.values():
             if bot.enable:
                 await bot.shutdown()
         self.ap.task_mgr.cancel_by_scope(core_entities.LifecycleControlScope.PLATFORM)
@@ -13,7 +13,7 @@ import langbot_plugin.api.entities.builtin.platform.message as platform_message
 import langbot_plugin.api.definition.abstract.platform.event_logger as abstract_platform_event_logger
 
 
-class EventLogLevel(enum.Enum):
+class EventLogLevel(enum.StrEnum):
     """日志级别"""
 
     DEBUG = 'debug'
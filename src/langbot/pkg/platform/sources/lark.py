@@ -1192,13 +1192,11 @@ class LarkAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter):
                             raise Exception(
                                 f'client.im.v1.message.create failed, code: {response.code}, msg: {response.msg}, log_id: {response.get_log_id()}, resp: \n{json.dumps(json.loads(response.raw.content), indent=4, ensure_ascii=False)}'
                             )
-                except Exception as e:
-                    print(f'im.chat.member.bot.added_v1: {e}')
+                except Exception:
                     await self.logger.error(f'Error in lark callback: {traceback.format_exc()}')
 
             return {'code': 200, 'message': 'ok'}
-        except Exception as e:
-            print(f'Error in lark callback: {e}')
+        except Exception:
             await self.logger.error(f'Error in lark callback: {traceback.format_exc()}')
             return {'code': 500, 'message': 'error'}
 
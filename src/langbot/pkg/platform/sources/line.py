@@ -251,7 +251,6 @@ class LINEAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter):
             return {'code': 200, 'message': 'ok'}
         except Exception:
             await self.logger.error(f'Error in LINE callback: {traceback.format_exc()}')
-            print(traceback.format_exc())
             return {'code': 500, 'message': 'error'}
 
     async def run_async(self):
@@ -38,15 +38,37 @@ class WebSocketSession:
     message_lists: dict[str, list[WebSocketMessage]] = {}
     """消息列表 {pipeline_uuid: [messages]}"""
 
+    message_dict_lists: dict[str, list[dict]] = {}
+    """与 message_lists 一一对应的序列化结果 {pipeline_uuid: [message dicts]}"""
+
     def __init__(self, id: str):
         self.id = id
         self.message_lists = {}
+        self.message_dict_lists = {}
 
     def get_message_list(self, pipeline_uuid: str) -> list[WebSocketMessage]:
         if pipeline_uuid not in self.message_lists:
             self.message_lists[pipeline_uuid] = []
         return self.message_lists[pipeline_uuid]
 
+    def get_message_dict_list(self, pipeline_uuid: str) -> list[dict]:
+        if pipeline_uuid not in self.message_dict_lists:
+            self.message_dict_lists[pipeline_uuid] = []
+        return self.message_dict_lists[pipeline_uuid]
+
+    def append_message(self, pipeline_uuid: str, message: WebSocketMessage, message_dict: dict):
+        """保存消息到历史记录
+
+        历史记录中的消息都已完成、不会再修改，因此连同广播时的序列化结果一起保存，读取历史时直接复用。
+        """
+        self.get_message_list(pipeline_uuid).append(message)
+        self.get_message_dict_list(pipeline_uuid).append(message_dict)
+
+    def reset(self, pipeline_uuid: str):
+        if pipeline_uuid in self.message_lists:
+            self.message_lists[pipeline_uuid] = []
+            self.message_dict_lists[pipeline_uuid] = []
+
 
 class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter):
     """WebSocket适配器 - 支持双向实时通信"""
@@ -69,6 +91,9 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
     stream_enabled: bool = pydantic.Field(default=True, exclude=True)
     """是否启用流式输出"""
 
+    listener_tasks: set[asyncio.Task] = pydantic.Field(default_factory=set, exclude=True)
+    """正在执行的事件处理任务，持有强引用以免任务在完成前被回收"""
+
     def __init__(self, config: dict, logger: abstract_platform_logger.AbstractEventLogger, **kwargs):
         super().__init__(
             config=config,
@@ -82,6 +107,7 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
         self.bot_account_id = 'websocketbot'
         self.outbound_message_queue = asyncio.Queue()
         self.stream_enabled = True
+        self.listener_tasks = set()
 
     async def send_message(
         self,
@@ -134,8 +160,11 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
             is_final=True,
         )
 
+        # 只序列化一次，历史记录、广播与返回值共用
+        message_dict = message_data.model_dump()
+
         # 保存到历史记录
-        session.get_message_list(pipeline_uuid).append(message_data)
+        session.append_message(pipeline_uuid, message_data, message_dict)
 
         # 直接广播到所有该pipeline的连接，包含session_type信息
         await ws_connection_manager.broadcast_to_pipeline(
@@ -143,12 +172,12 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
             {
                 'type': 'response',
                 'session_type': session_type,
-                'data': message_data.model_dump(),
+                'data': message_dict,
             },
             session_type=session_type,
         )
 
-        return message_data.model_dump()
+        return message_dict
 
     async def reply_message_chunk(
         self,
@@ -183,10 +212,11 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
                 timestamp=datetime.now().isoformat(),
                 is_final=is_final and bot_message.tool_calls is None,
             )
+            message_dict = message_data.model_dump()
 
             # 只有在is_final时才保存到历史记录
             if is_final and bot_message.tool_calls is None:
-                message_list.append(message_data)
+                session.append_message(pipeline_uuid, message_data, message_dict)
         else:
             # 更新最后一条消息
             msg_id = message_list[-1].id
@@ -198,10 +228,12 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
                 timestamp=message_list[-1].timestamp,  # 保持原始时间戳
                 is_final=is_final and bot_message.tool_calls is None,
             )
+            message_dict = message_data.model_dump()
 
             # 如果是final，更新历史记录中的最后一条
             if is_final and bot_message.tool_calls is None:
                 message_list[-1] = message_data
+                session.get_message_dict_list(pipeline_uuid)[-1] = message_dict
 
         # 直接广播到所有该pipeline的连接，包含session_type信息
         await ws_connection_manager.broadcast_to_pipeline(
@@ -209,12 +241,12 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
             {
                 'type': 'response',
                 'session_type': session_type,
-                'data': message_data.model_dump(),
+                'data': message_dict,
             },
             session_type=session_type,
         )
 
-        return message_data.model_dump()
+        return message_dict
 
     async def is_stream_output_supported(self) -> bool:
         """根据stream_enabled标志返回是否支持流式输出"""
@@ -343,17 +375,22 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
         # 生成消息ID
         message_id = len(use_session.get_message_list(pipeline_uuid)) + 1
 
+        # 同一条用户消息的记录、消息源和事件共用一个时间戳
+        now = datetime.now()
+        timestamp = now.timestamp()
+
         # 保存用户消息
         user_message = WebSocketMessage(
             id=message_id,
             role='user',
             content=str(message_chain),
             message_chain=message_chain_obj,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now.isoformat(),
             connection_id=connection.connection_id,
             is_final=True,  # 用户消息始终是完整的，非流式
         )
-        use_session.get_message_list(pipeline_uuid).append(user_message)
+        user_message_dict = user_message.model_dump()
+        use_session.append_message(pipeline_uuid, user_message, user_message_dict)
 
         # 广播用户消息到所有连接（包括发送者），包含session_type信息
         await ws_connection_manager.broadcast_to_pipeline(
@@ -361,22 +398,20 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
             {
                 'type': 'user_message',
                 'session_type': session_type,
-                'data': user_message.model_dump(),
+                'data': user_message_dict,
             },
             session_type=session_type,
         )
 
         # 添加消息源
-        message_chain.insert(0, platform_message.Source(id=message_id, time=datetime.now().timestamp()))
+        message_chain.insert(0, platform_message.Source(id=message_id, time=timestamp))
 
         # 创建事件
         if session_type == 'person':
             sender = platform_entities.Friend(
                 id=f'websocket_{connection.connection_id}', nickname='User', remark='User'
             )
-            event = platform_events.FriendMessage(
-                sender=sender, message_chain=message_chain, time=datetime.now().timestamp()
-            )
+            event = platform_events.FriendMessage(sender=sender, message_chain=message_chain, time=timestamp)
         else:
             group = platform_entities.Group(
                 id='websocketgroup', name='Group', permission=platform_entities.Permission.Member
@@ -387,29 +422,34 @@ class WebSocketAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter)
                 group=group,
                 permission=platform_entities.Permission.Member,
             )
-            event = platform_events.GroupMessage(
-                sender=sender, message_chain=message_chain, time=datetime.now().timestamp()
-            )
+            event = platform_events.GroupMessage(sender=sender, message_chain=message_chain, time=timestamp)
 
         # 设置流水线UUID
         self.ap.platform_mgr.websocket_proxy_bot.bot_entity.use_pipeline_uuid = pipeline_uuid
 
         # 异步触发事件处理（不等待结果）
         if event.__class__ in self.listeners:
-            asyncio.create_task(self.listeners[event.__class__](event, self))
+            task = asyncio.create_task(self.listeners[event.__class__](event, self))
+            self.listener_tasks.add(task)
+            task.add_done_callback(self._on_listener_task_done)
+
+    def _on_listener_task_done(self, task: asyncio.Task):
+        """事件处理任务结束：释放引用，并记录未被处理的异常"""
+        self.listener_tasks.discard(task)
+
+        if not task.cancelled() and task.exception() is not None:
+            logger.error('WebSocket event listener failed', exc_info=task.exception())
 
     def get_websocket_messages(self, pipeline_uuid: str, session_type: str) -> list[dict]:
         """获取消息历史"""
         if session_type == 'person':
-            return [message.model_dump() for message in self.websocket_person_session.get_message_list(pipeline_uuid)]
+            return list(self.websocket_person_session.get_message_dict_list(pipeline_uuid))
         else:
-            return [message.model_dump() for message in self.websocket_group_session.get_message_list(pipeline_uuid)]
+            return list(self.websocket_group_session.get_message_dict_list(pipeline_uuid))
 
     def reset_session(self, pipeline_uuid: str, session_type: str):
         """重置会话"""
         if session_type == 'person':
-            if pipeline_uuid in self.websocket_person_session.message_lists:
-                self.websocket_person_session.message_lists[pipeline_uuid] = []
+            self.websocket_person_session.reset(pipeline_uuid)
         else:
-            if pipeline_uuid in self.websocket_group_session.message_lists:
-                self.websocket_group_session.message_lists[pipeline_uuid] = []
+            self.websocket_group_session.reset(pipeline_uuid)
@@ -273,7 +273,6 @@ class WecomBotAdapter(abstract_platform_adapter.AbstractMessagePlatformAdapter):
                 return await callback(await self.event_converter.target2yiri(event), self)
             except Exception:
                 await self.logger.error(f'Error in wecombot callback: {traceback.format_exc()}')
-                print(traceback.format_exc())
 
         try:
             if event_type == platform_events.FriendMessage:
@@ -12,15 +12,57 @@ if TYPE_CHECKING:
 import langbot_plugin.api.entities.builtin.platform.events as platform_events
 
 
+WEBHOOK_TIMEOUT = aiohttp.ClientTimeout(total=15)
+"""Timeout for a single webhook push"""
+
+WEBHOOK_DRAIN_LIMIT = 64 * 1024
+"""Max bytes of an unused webhook reply read only to return its connection to the pool"""
+
+
+async def _drain_response(response: aiohttp.ClientResponse):
+    """Read and discard a small reply body so aiohttp can reuse the keep-alive connection
+
+    aiohttp closes a connection whose body was left unread; larger bodies are dropped together with their connection.
+    """
+    drained = 0
+    while drained <= WEBHOOK_DRAIN_LIMIT:
+        chunk = await response.content.read(WEBHOOK_DRAIN_LIMIT)
+        if not chunk:
+            return
+        drained += len(chunk)
+
+
 class WebhookPusher:
     """Push bot events to configured webhooks"""
 
     ap: app.Application
     logger: logging.Logger
 
+    _session: aiohttp.ClientSession | None
+
     def __init__(self, ap: app.Application):
         self.ap = ap
         self.logger = self.ap.logger
+        self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, so pushes reuse pooled keep-alive connections"""
+        if self._session is None or self._session.closed:
+            webhook_cfg = self.ap.instance_config.data.get('webhook', {})
+            connector = aiohttp.TCPConnector(
+                limit=webhook_cfg.get('pool_size', 100),
+                limit_per_host=webhook_cfg.get('limit_per_host', 0),
+                ttl_dns_cache=300,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def shutdown(self):
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     async def push_person_message(self, event: platform_events.FriendMessage, bot_uuid: str, adapter_name: str) -> bool:
         """Push person message event to webhooks
@@ -28,42 +70,7 @@ class WebhookPusher:
         Returns:
             bool: True if any webhook responded with skip_pipeline=true, False otherwise
         """
-        try:
-            webhooks = await self.ap.webhook_service.get_enabled_webhooks()
-            if not webhooks:
-                return False
-
-            # Build payload
-            payload = {
-                'uuid': str(uuid.uuid4()),  # unique id for the event
-                'event_type': 'bot.person_message',
-                'data': {
-                    'bot_uuid': bot_uuid,
-                    'adapter_name': adapter_name,
-                    'sender': {
-                        'id': str(event.sender.id),
-                        'name': getattr(event.sender, 'name', ''),
-                    },
-                    'message': event.message_chain.model_dump(),
-                    'timestamp': event.time if hasattr(event, 'time') else None,
-                },
-            }
-
-            # Push to all webhooks asynchronously
-            tasks = [self._push_to_webhook(webhook['url'], payload) for webhook in webhooks]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Check if any webhook responded with skip_pipeline=true
-            for result in results:
-                if isinstance(result, dict) and result.get('skip_pipeline') is True:
-                    self.logger.info(f'Webhook responded with skip_pipeline=true, skipping pipeline for person message')
-                    return True
-
-            return False
-
-        except Exception as e:
-            self.logger.error(f'Failed to push person message to webhooks: {e}')
-            return False
+        return await self._push_message_event('person', event, bot_uuid, adapter_name)
 
     async def push_group_message(self, event: platform_events.GroupMessage, bot_uuid: str, adapter_name: str) -> bool:
         """Push group message event to webhooks
@@ -71,30 +78,43 @@ class WebhookPusher:
         Returns:
             bool: True if any webhook responded with skip_pipeline=true, False otherwise
         """
+        return await self._push_message_event('group', event, bot_uuid, adapter_name)
+
+    def _build_message_payload(
+        self, message_type: str, event: platform_events.MessageEvent, bot_uuid: str, adapter_name: str
+    ) -> dict:
+        """Build the webhook payload shared by person and group message events"""
+        data = {
+            'bot_uuid': bot_uuid,
+            'adapter_name': adapter_name,
+        }
+        if message_type == 'group':
+            data['group'] = {
+                'id': str(event.group.id),
+                'name': event.group.name,
+            }
+        data['sender'] = {
+            'id': str(event.sender.id),
+            'name': getattr(event.sender, 'name', ''),
+        }
+        data['message'] = event.message_chain.model_dump()
+        data['timestamp'] = event.time
+
+        return {
+            'uuid': str(uuid.uuid4()),  # unique id for the event
+            'event_type': f'bot.{message_type}_message',
+            'data': data,
+        }
+
+    async def _push_message_event(
+        self, message_type: str, event: platform_events.MessageEvent, bot_uuid: str, adapter_name: str
+    ) -> bool:
         try:
             webhooks = await self.ap.webhook_service.get_enabled_webhooks()
             if not webhooks:
                 return False
 
-            # Build payload
-            payload = {
-                'uuid': str(uuid.uuid4()),  # unique id for the event
-                'event_type': 'bot.group_message',
-                'data': {
-                    'bot_uuid': bot_uuid,
-                    'adapter_name': adapter_name,
-                    'group': {
-                        'id': str(event.group.id),
-                        'name': getattr(event.group, 'name', ''),
-                    },
-                    'sender': {
-                        'id': str(event.sender.id),
-                        'name': getattr(event.sender, 'name', ''),
-                    },
-                    'message': event.message_chain.model_dump(),
-                    'timestamp': event.time if hasattr(event, 'time') else None,
-                },
-            }
+            payload = self._build_message_payload(message_type, event, bot_uuid, adapter_name)
 
             # Push to all webhooks asynchronously
             tasks = [self._push_to_webhook(webhook['url'], payload) for webhook in webhooks]
@@ -103,13 +123,15 @@ class WebhookPusher:
             # Check if any webhook responded with skip_pipeline=true
             for result in results:
                 if isinstance(result, dict) and result.get('skip_pipeline') is True:
-                    self.logger.info(f'Webhook responded with skip_pipeline=true, skipping pipeline for group message')
+                    self.logger.info(
+                        f'Webhook responded with skip_pipeline=true, skipping pipeline for {message_type} message'
+                    )
                     return True
 
             return False
 
         except Exception as e:
-            self.logger.error(f'Failed to push group message to webhooks: {e}')
+            self.logger.error(f'Failed to push {message_type} message to webhooks: {e}')
             return False
 
     async def _push_to_webhook(self, url: str, payload: dict) -> dict | None:
@@ -119,23 +141,32 @@ class WebhookPusher:
             dict | None: The response JSON if successful, None otherwise
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    url,
-                    json=payload,
-                    headers={'Content-Type': 'application/json'},
-                    timeout=aiohttp.ClientTimeout(total=15),
-                ) as response:
-                    if response.status >= 400:
-                        self.logger.warning(f'Webhook {url} returned status {response.status}')
+            session = self._get_session()
+            async with session.post(
+                url,
+                json=payload,
+                headers={'Content-Type': 'application/json'},
+                timeout=WEBHOOK_TIMEOUT,
+            ) as response:
+                if response.status >= 400:
+                    self.logger.warning(f'Webhook {url} returned status {response.status}')
+                    await _drain_response(response)
+                    return None
+                else:
+                    self.logger.debug(f'Successfully pushed to webhook {url}')
+                    # Only a JSON body can carry skip_pipeline, anything else is drained without decoding.
+                    # Accept application/*+json as well, matching what response.json() itself accepts.
+                    content_type = response.content_type
+                    if content_type != 'application/json' and not (
+                        content_type.startswith('application/') and content_type.endswith('+json')
+                    ):
+                        await _drain_response(response)
+                        return None
+                    try:
+                        return await response.json()
+                    except Exception as json_error:
+                        self.logger.debug(f'Failed to parse JSON response from webhook {url}: {json_error}')
                         return None
-                    else:
-                        self.logger.debug(f'Successfully pushed to webhook {url}')
-                        try:
-                            return await response.json()
-                        except Exception as json_error:
-                            self.logger.debug(f'Failed to parse JSON response from webhook {url}: {json_error}')
-                            return None
         except asyncio.TimeoutError:
             self.logger.warning(f'Timeout pushing to webhook {url}')
             return None
@@ -37,7 +37,7 @@ class PluginRuntimeConnector:
 
     ap: app.Application
 
-    handler: handler.RuntimeConnectionHandler
+    handler: handler.RuntimeConnectionHandler | None = None
 
     handler_task: asyncio.Task
 
@@ -194,7 +194,7 @@ class PluginRuntimeConnector:
         pass
 
     async def ping_plugin_runtime(self):
-        if not hasattr(self, 'handler'):
+        if self.handler is None:
             raise Exception('Plugin runtime is not connected')
 
         return await self.handler.ping()
@@ -6,6 +6,8 @@ import base64
 import traceback
 
 import sqlalchemy
+import sqlalchemy.dialects.postgresql as sqlalchemy_postgresql
+import sqlalchemy.dialects.sqlite as sqlalchemy_sqlite
 
 from langbot_plugin.runtime.io import handler
 from langbot_plugin.runtime.io.connection import Connection
@@ -139,7 +141,8 @@ class RuntimeConnectionHandler(handler.Handler):
 
             message_chain_obj = platform_message.MessageChain.model_validate(message_chain)
 
-            self.ap.logger.debug(f'Reply message: {message_chain_obj.model_dump(serialize_as_any=False)}')
+            # message_chain 本身就是序列化后的形式，无需再 model_dump 一次；未开启 DEBUG 时不格式化
+            self.ap.logger.debug('Reply message: %s', message_chain)
 
             await query.adapter.reply_message(
                 query.message_event,
@@ -346,31 +349,25 @@ class RuntimeConnectionHandler(handler.Handler):
             owner = data['owner']
             value = base64.b64decode(data['value_base64'])
 
-            result = await self.ap.persistence_mgr.execute_async(
-                sqlalchemy.select(persistence_bstorage.BinaryStorage)
-                .where(persistence_bstorage.BinaryStorage.key == key)
-                .where(persistence_bstorage.BinaryStorage.owner_type == owner_type)
-                .where(persistence_bstorage.BinaryStorage.owner == owner)
+            # upsert on the primary key, so the write is a single atomic statement
+            if self.ap.persistence_mgr.db.name == 'postgresql':
+                insert = sqlalchemy_postgresql.insert
+            else:
+                insert = sqlalchemy_sqlite.insert
+
+            stmt = insert(persistence_bstorage.BinaryStorage).values(
+                unique_key=f'{owner_type}:{owner}:{key}',
+                key=key,
+                owner_type=owner_type,
+                owner=owner,
+                value=value,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[persistence_bstorage.BinaryStorage.unique_key],
+                set_={'value': stmt.excluded.value, 'updated_at': sqlalchemy.func.now()},
             )
 
-            if result.first() is not None:
-                await self.ap.persistence_mgr.execute_async(
-                    sqlalchemy.update(persistence_bstorage.BinaryStorage)
-                    .where(persistence_bstorage.BinaryStorage.key == key)
-                    .where(persistence_bstorage.BinaryStorage.owner_type == owner_type)
-                    .where(persistence_bstorage.BinaryStorage.owner == owner)
-                    .values(value=value)
-                )
-            else:
-                await self.ap.persistence_mgr.execute_async(
-                    sqlalchemy.insert(persistence_bstorage.BinaryStorage).values(
-                        unique_key=f'{owner_type}:{owner}:{key}',
-                        key=key,
-                        owner_type=owner_type,
-                        owner=owner,
-                        value=value,
-                    )
-                )
+            await self.ap.persistence_mgr.execute_async(stmt)
 
             return handler.ActionResponse.success(
                 data={},
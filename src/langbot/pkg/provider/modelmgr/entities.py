@@ -25,3 +25,5 @@ class LLMModelInfo(pydantic.BaseModel):
 
     class Config:
         arbitrary_types_allowed = True
+        # 仅作为旧接口的类型标注保留，运行时几乎不实例化，首次校验时再构建 schema
+        defer_build = True
@@ -24,7 +24,13 @@ class ModelManager:
 
     requester_components: list[engine.Component]
 
-    requester_dict: dict[str, type[requester.ProviderAPIRequester]]  # cache
+    requester_dict: dict[str, type[requester.ProviderAPIRequester]]  # cache, filled lazily by get_requester_class
+
+    requester_infos: dict[str, dict]  # cache, plain dicts of requester manifests keyed by name
+
+    requester_infos_by_type: dict[str, list[dict]]  # cache, requester_infos bucketed by supported model type
+
+    requester_component_dict: dict[str, engine.Component]  # cache, requester components keyed by name
 
     def __init__(self, ap: app.Application):
         self.ap = ap
@@ -32,16 +38,25 @@ class ModelManager:
         self.embedding_models = []
         self.requester_components = []
         self.requester_dict = {}
+        self.requester_infos = {}
+        self.requester_infos_by_type = {}
+        self.requester_component_dict = {}
 
     async def initialize(self):
         self.requester_components = self.ap.discover.get_components_by_kind('LLMAPIRequester')
 
-        # forge requester class dict
-        requester_dict: dict[str, type[requester.ProviderAPIRequester]] = {}
-        for component in self.requester_components:
-            requester_dict[component.metadata.name] = component.get_python_component_class()
+        # manifests are static for the process lifetime, render them only once
+        self.requester_infos = {
+            component.metadata.name: component.to_plain_dict() for component in self.requester_components
+        }
 
-        self.requester_dict = requester_dict
+        requester_infos_by_type: dict[str, list[dict]] = {}
+        for info in self.requester_infos.values():
+            for model_type in info['spec']['support_type']:
+                requester_infos_by_type.setdefault(model_type, []).append(info)
+        self.requester_infos_by_type = requester_infos_by_type
+
+        self.requester_component_dict = {component.metadata.name: component for component in self.requester_components}
 
         await self.load_models_from_db()
 
@@ -76,6 +91,17 @@ class ModelManager:
             except Exception as e:
                 self.ap.logger.error(f'Failed to load model {embedding_model.uuid}: {e}\n{traceback.format_exc()}')
 
+    def get_requester_class(self, name: str) -> type[requester.ProviderAPIRequester] | None:
+        """获取请求器类，首次使用时才导入其模块"""
+        requester_class = self.requester_dict.get(name)
+        if requester_class is None:
+            component = self.requester_component_dict.get(name)
+            if component is None:
+                return None
+            requester_class = component.get_python_component_class()
+            self.requester_dict[name] = requester_class
+        return requester_class
+
     async def init_runtime_llm_model(
         self,
         model_info: persistence_model.LLMModel | sqlalchemy.Row[persistence_model.LLMModel] | dict,
@@ -86,10 +112,11 @@ class ModelManager:
         elif isinstance(model_info, dict):
             model_info = persistence_model.LLMModel(**model_info)
 
-        if model_info.requester not in self.requester_dict:
+        requester_class = self.get_requester_class(model_info.requester)
+        if requester_class is None:
             raise provider_errors.RequesterNotFoundError(model_info.requester)
 
-        requester_inst = self.requester_dict[model_info.requester](ap=self.ap, config=model_info.requester_config)
+        requester_inst = requester_class(ap=self.ap, config=model_info.requester_config)
 
         await requester_inst.initialize()
 
@@ -114,10 +141,11 @@ class ModelManager:
         elif isinstance(model_info, dict):
             model_info = persistence_model.EmbeddingModel(**model_info)
 
-        if model_info.requester not in self.requester_dict:
+        requester_class = self.get_requester_class(model_info.requester)
+        if requester_class is None:
             raise provider_errors.RequesterNotFoundError(model_info.requester)
 
-        requester_inst = self.requester_dict[model_info.requester](ap=self.ap, config=model_info.requester_config)
+        requester_inst = requester_class(ap=self.ap, config=model_info.requester_config)
 
         await requester_inst.initialize()
 
@@ -179,24 +207,14 @@ class ModelManager:
     def get_available_requesters_info(self, model_type: str) -> list[dict]:
         """获取所有可用的请求器"""
         if model_type != '':
-            return [
-                component.to_plain_dict()
-                for component in self.requester_components
-                if model_type in component.spec['support_type']
-            ]
+            return list(self.requester_infos_by_type.get(model_type, ()))
         else:
-            return [component.to_plain_dict() for component in self.requester_components]
+            return list(self.requester_infos.values())
 
     def get_available_requester_info_by_name(self, name: str) -> dict | None:
         """通过名称获取请求器信息"""
-        for component in self.requester_components:
-            if component.metadata.name == name:
-                return component.to_plain_dict()
-        return None
+        return self.requester_infos.get(name)
 
     def get_available_requester_manifest_by_name(self, name: str) -> engine.Component | None:
         """通过名称获取请求器清单"""
-        for component in self.requester_components:
-            if component.metadata.name == name:
-                return component
-        return None
+        return self.requester_component_dict.get(name)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import collections
 import typing
 
 from ...core import app
@@ -46,6 +47,9 @@ class RuntimeEmbeddingModel:
     requester: ProviderAPIRequester
     """请求器实例"""
 
+    query_embedding_cache: collections.OrderedDict[str, list[float]]
+    """检索查询文本的向量缓存，key 为文本摘要；模型重新加载时随实例一同失效"""
+
     def __init__(
         self,
         model_entity: persistence_model.EmbeddingModel,
@@ -55,6 +59,7 @@ class RuntimeEmbeddingModel:
         self.model_entity = model_entity
         self.token_mgr = token_mgr
         self.requester = requester
+        self.query_embedding_cache = collections.OrderedDict()
 
 
 class ProviderAPIRequester(metaclass=abc.ABCMeta):
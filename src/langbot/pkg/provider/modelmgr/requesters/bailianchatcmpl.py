@@ -47,7 +47,7 @@ class BailianChatCompletions(modelscopechatcmpl.ModelScopeChatCompletions):
         is_use_dashscope_call = False  # 是否使用阿里原生库调用
         is_enable_multi_model = True  # 是否支持多轮对话
         use_time_num = 0  # 模型已调用次数，防止存在多文件时重复调用
-        use_time_ids = []  # 已调用的ID列表
+        use_time_ids: dict[int, None] = {}  # 已调用的ID，以 dict 作为有序集合，同一消息多个附件只记一次
         message_id = 0  # 记录消息序号
 
         for msg in messages:
@@ -68,7 +68,7 @@ class BailianChatCompletions(modelscopechatcmpl.ModelScopeChatCompletions):
                             del me['file_url']
                             del me['file_name']
                             use_time_num += 1
-                            use_time_ids.append(message_id)
+                            use_time_ids[message_id] = None
                             is_enable_multi_model = False
                         # 2. 语音文件识别, 无法通过openai的audio字段传递，暂时不支持
                         # https://bailian.console.aliyun.com/?tab=doc#/doc/?type=model&url=2979031
@@ -93,13 +93,14 @@ class BailianChatCompletions(modelscopechatcmpl.ModelScopeChatCompletions):
                             del me['file_name']
                             is_use_dashscope_call = True
                             use_time_num += 1
-                            use_time_ids.append(message_id)
+                            use_time_ids[message_id] = None
                             is_enable_multi_model = False
             message_id += 1
 
-        # 使用列表推导式，保留不在 use_time_ids[:-1] 中的元素，仅保留最后一个多媒体消息
+        # 仅保留最后一个多媒体消息，其余多媒体消息的序号放入集合中一次性过滤
         if not is_enable_multi_model and use_time_num > 1:
-            messages = [msg for idx, msg in enumerate(messages) if idx not in use_time_ids[:-1]]
+            dropped_ids = set(list(use_time_ids)[:-1])
+            messages = [msg for idx, msg in enumerate(messages) if idx not in dropped_ids]
 
         if not is_enable_multi_model:
             messages = [msg for msg in messages if 'resp_message_id' not in msg]
@@ -169,9 +170,12 @@ class BailianChatCompletions(modelscopechatcmpl.ModelScopeChatCompletions):
         else:
             async for chunk in self._req_stream(args, extra_body=extra_args):
                 # 解析 chunk 数据
-                if hasattr(chunk, 'choices') and chunk.choices:
-                    choice = chunk.choices[0]
-                    delta = choice.delta.model_dump() if hasattr(choice, 'delta') else {}
+                # 每个 chunk 上各字段只查找一次
+                choices = getattr(chunk, 'choices', None)
+                if choices:
+                    choice = choices[0]
+                    choice_delta = getattr(choice, 'delta', None)
+                    delta = choice_delta.model_dump() if choice_delta is not None else {}
                     finish_reason = getattr(choice, 'finish_reason', None)
                 else:
                     delta = {}
@@ -226,16 +230,16 @@ class BailianChatCompletions(modelscopechatcmpl.ModelScopeChatCompletions):
                     chunk_idx += 1
                     continue
 
-                # 构建 MessageChunk - 只包含增量内容
+                # 构建 MessageChunk - 只包含增量内容，值为空的字段直接不写入
                 chunk_data = {
                     'role': role,
-                    'content': delta_content if delta_content else None,
-                    'tool_calls': delta.get('tool_calls'),
                     'is_final': bool(finish_reason),
                 }
-
-                # 移除 None 值
-                chunk_data = {k: v for k, v in chunk_data.items() if v is not None}
+                if delta_content:
+                    chunk_data['content'] = delta_content
+                delta_tool_calls = delta.get('tool_calls')
+                if delta_tool_calls is not None:
+                    chunk_data['tool_calls'] = delta_tool_calls
 
                 yield provider_message.MessageChunk(**chunk_data)
                 chunk_idx += 1
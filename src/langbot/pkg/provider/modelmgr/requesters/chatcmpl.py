@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import typing
 
 import openai
@@ -99,8 +100,6 @@ class OpenAIChatCompletions(requester.ProviderAPIRequester):
 
         # 2. 从 content 中提取 <think> 标签内容
         if content and '<think>' in content and '</think>' in content:
-            import re
-
             think_pattern = r'<think>(.*?)</think>'
             think_matches = re.findall(think_pattern, content, re.DOTALL)
             if think_matches:
@@ -168,9 +167,12 @@ class OpenAIChatCompletions(requester.ProviderAPIRequester):
         async for chunk in self._req_stream(args, extra_body=extra_args):
             # 解析 chunk 数据
 
-            if hasattr(chunk, 'choices') and chunk.choices:
-                choice = chunk.choices[0]
-                delta = choice.delta.model_dump() if hasattr(choice, 'delta') else {}
+            # 每个 chunk 上各字段只查找一次
+            choices = getattr(chunk, 'choices', None)
+            if choices:
+                choice = choices[0]
+                choice_delta = getattr(choice, 'delta', None)
+                delta = choice_delta.model_dump() if choice_delta is not None else {}
 
                 finish_reason = getattr(choice, 'finish_reason', None)
             else:
@@ -228,16 +230,16 @@ class OpenAIChatCompletions(requester.ProviderAPIRequester):
             if chunk_idx == 0 and not delta_content and not reasoning_content and not delta.get('tool_calls'):
                 chunk_idx += 1
                 continue
-            # 构建 MessageChunk - 只包含增量内容
+            # 构建 MessageChunk - 只包含增量内容，值为空的字段直接不写入
             chunk_data = {
                 'role': role,
-                'content': delta_content if delta_content else None,
-                'tool_calls': delta.get('tool_calls'),
                 'is_final': bool(finish_reason),
             }
-
-            # 移除 None 值
-            chunk_data = {k: v for k, v in chunk_data.items() if v is not None}
+            if delta_content:
+                chunk_data['content'] = delta_content
+            delta_tool_calls = delta.get('tool_calls')
+            if delta_tool_calls is not None:
+                chunk_data['tool_calls'] = delta_tool_calls
 
             yield provider_message.MessageChunk(**chunk_data)
             chunk_idx += 1
@@ -58,7 +58,8 @@ class ModelScopeChatCompletions(requester.ProviderAPIRequester):
             if not chunk or not chunk.id or not chunk.choices or not chunk.choices[0] or not chunk.choices[0].delta:
                 continue
 
-            delta = chunk.choices[0].delta.model_dump() if hasattr(chunk.choices[0], 'delta') else {}
+            # 上面已确认 delta 存在
+            delta = chunk.choices[0].delta.model_dump()
             reasoning_content = delta.get('reasoning_content')
             # 处理 reasoning_content
             if reasoning_content:
@@ -217,9 +218,12 @@ class ModelScopeChatCompletions(requester.ProviderAPIRequester):
 
         async for chunk in self._req_stream(args, extra_body=extra_args):
             # 解析 chunk 数据
-            if hasattr(chunk, 'choices') and chunk.choices:
-                choice = chunk.choices[0]
-                delta = choice.delta.model_dump() if hasattr(choice, 'delta') else {}
+            # 每个 chunk 上各字段只查找一次
+            choices = getattr(chunk, 'choices', None)
+            if choices:
+                choice = choices[0]
+                choice_delta = getattr(choice, 'delta', None)
+                delta = choice_delta.model_dump() if choice_delta is not None else {}
                 finish_reason = getattr(choice, 'finish_reason', None)
             else:
                 delta = {}
@@ -281,16 +285,16 @@ class ModelScopeChatCompletions(requester.ProviderAPIRequester):
                 chunk_idx += 1
                 continue
 
-            # 构建 MessageChunk - 只包含增量内容
+            # 构建 MessageChunk - 只包含增量内容，值为空的字段直接不写入
             chunk_data = {
                 'role': role,
-                'content': delta_content if delta_content else None,
-                'tool_calls': delta.get('tool_calls'),
                 'is_final': bool(finish_reason),
             }
-
-            # 移除 None 值
-            chunk_data = {k: v for k, v in chunk_data.items() if v is not None}
+            if delta_content:
+                chunk_data['content'] = delta_content
+            delta_tool_calls = delta.get('tool_calls')
+            if delta_tool_calls is not None:
+                chunk_data['tool_calls'] = delta_tool_calls
 
             yield provider_message.MessageChunk(**chunk_data)
             chunk_idx += 1
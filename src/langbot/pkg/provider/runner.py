@@ -39,3 +39,7 @@ class RequestRunner(abc.ABC):
     ) -> typing.AsyncGenerator[llm_entities.Message | llm_entities.MessageChunk, None]:
         """运行请求"""
         pass
+
+    async def dispose(self):
+        """释放运行器持有的资源，流水线移除或重载时调用"""
+        pass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import typing
+import re
 import json
 import base64
 
@@ -42,8 +43,6 @@ class CozeAPIRunner(runner.RequestRunner):
         thinking_content = ''
         # 从 content 中提取 <think> 标签内容
         if content and '<think>' in content and '</think>' in content:
-            import re
-
             think_pattern = r'<think>(.*?)</think>'
             think_matches = re.findall(think_pattern, content, re.DOTALL)
             if think_matches:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import typing
+import asyncio
+import re
 import json
 import uuid
 import base64
@@ -22,15 +24,27 @@ class DifyServiceAPIRunner(runner.RequestRunner):
 
     dify_client: client.AsyncDifyServiceClient
 
+    _active_runs: int
+    """正在执行的 run 调用数"""
+
+    _disposed: bool
+    """流水线已移除，最后一个请求结束后关闭客户端"""
+
     def __init__(self, ap: app.Application, pipeline_config: dict):
         self.ap = ap
         self.pipeline_config = pipeline_config
 
-        valid_app_types = ['chat', 'agent', 'workflow']
-        if self.pipeline_config['ai']['dify-service-api']['app-type'] not in valid_app_types:
+        # 应用类型在运行器生命周期内不变，按类型解析一次请求方法，run 中直接调用
+        app_type_handlers = {
+            'chat': (self._chat_messages_chunk, self._chat_messages),
+            'agent': (self._agent_chat_messages_chunk, self._agent_chat_messages),
+            'workflow': (self._workflow_messages_chunk, self._workflow_messages),
+        }.get(self.pipeline_config['ai']['dify-service-api']['app-type'])
+        if app_type_handlers is None:
             raise errors.DifyAPIError(
                 f'不支持的 Dify 应用类型: {self.pipeline_config["ai"]["dify-service-api"]["app-type"]}'
             )
+        self._stream_handler, self._handler = app_type_handlers
 
         api_key = self.pipeline_config['ai']['dify-service-api']['api-key']
 
@@ -38,6 +52,8 @@ class DifyServiceAPIRunner(runner.RequestRunner):
             api_key=api_key,
             base_url=self.pipeline_config['ai']['dify-service-api']['base-url'],
         )
+        self._active_runs = 0
+        self._disposed = False
 
     def _process_thinking_content(
         self,
@@ -54,8 +70,6 @@ class DifyServiceAPIRunner(runner.RequestRunner):
         thinking_content = ''
         # 从 content 中提取 <think> 标签内容
         if content and '<think>' in content and '</think>' in content:
-            import re
-
             think_pattern = r'<think>(.*?)</think>'
             think_matches = re.findall(think_pattern, content, re.DOTALL)
             if think_matches:
@@ -110,36 +124,58 @@ class DifyServiceAPIRunner(runner.RequestRunner):
                 return 'video'
             return 'document'
 
+        async def upload_image_base64(ce: provider_message.ContentElement) -> dict:
+            image_b64, image_format = await image.extract_b64_and_format(ce.image_base64)
+            file_bytes = base64.b64decode(image_b64)
+            image_id = await upload_file_bytes(f'img.{image_format}', file_bytes, f'image/{image_format}')
+            return {'type': 'image', 'id': image_id}
+
+        async def upload_file_url(ce: provider_message.ContentElement) -> dict | None:
+            file_url = getattr(ce, 'file_url', None)
+            file_name = getattr(ce, 'file_name', None) or 'file'
+            try:
+                file_bytes, content_type = await download_file(file_url)
+                file_id = await upload_file_bytes(file_name, file_bytes, content_type)
+                file_type = _detect_file_type(content_type)
+                return {'type': file_type, 'id': file_id}
+            except Exception as e:
+                self.ap.logger.warning(f'dify file upload failed: {e}')
+                return None
+
+        async def upload_file_base64(ce: provider_message.ContentElement) -> dict:
+            file_name = getattr(ce, 'file_name', None) or 'file'
+
+            header, b64_data = ce.file_base64.split(',', 1)
+            content_type = 'application/octet-stream'
+            if ';' in header:
+                content_type = header.split(';')[0][5:] or content_type
+            file_bytes = base64.b64decode(b64_data)
+            file_id = await upload_file_bytes(file_name, file_bytes, content_type)
+            file_type = _detect_file_type(content_type)
+            return {'type': file_type, 'id': file_id}
+
         if isinstance(query.user_message.content, list):
+            upload_tasks = []
             for ce in query.user_message.content:
                 if ce.type == 'text':
                     plain_text += ce.text
                 elif ce.type == 'image_base64':
-                    image_b64, image_format = await image.extract_b64_and_format(ce.image_base64)
-                    file_bytes = base64.b64decode(image_b64)
-                    image_id = await upload_file_bytes(f'img.{image_format}', file_bytes, f'image/{image_format}')
-                    upload_files.append({'type': 'image', 'id': image_id})
+                    upload_tasks.append(upload_image_base64(ce))
                 elif ce.type == 'file_url':
-                    file_url = getattr(ce, 'file_url', None)
-                    file_name = getattr(ce, 'file_name', None) or 'file'
-                    try:
-                        file_bytes, content_type = await download_file(file_url)
-                        file_id = await upload_file_bytes(file_name, file_bytes, content_type)
-                        file_type = _detect_file_type(content_type)
-                        upload_files.append({'type': file_type, 'id': file_id})
-                    except Exception as e:
-                        self.ap.logger.warning(f'dify file upload failed: {e}')
+                    upload_tasks.append(upload_file_url(ce))
                 elif ce.type == 'file_base64':
-                    file_name = getattr(ce, 'file_name', None) or 'file'
-
-                    header, b64_data = ce.file_base64.split(',', 1)
-                    content_type = 'application/octet-stream'
-                    if ';' in header:
-                        content_type = header.split(';')[0][5:] or content_type
-                    file_bytes = base64.b64decode(b64_data)
-                    file_id = await upload_file_bytes(file_name, file_bytes, content_type)
-                    file_type = _detect_file_type(content_type)
-                    upload_files.append({'type': file_type, 'id': file_id})
+                    upload_tasks.append(upload_file_base64(ce))
+
+            # 各文件的下载与上传互不依赖，并发执行，结果保持消息中的顺序
+            # 任一上传失败时 TaskGroup 会取消其余上传，与逐个上传时遇错即止的行为一致
+            if upload_tasks:
+                try:
+                    async with asyncio.TaskGroup() as tg:
+                        running_uploads = [tg.create_task(upload_task) for upload_task in upload_tasks]
+                except ExceptionGroup as eg:
+                    # 对调用方抛出原始异常，而不是异常组
+                    raise eg.exceptions[0] from None
+                upload_files = [task.result() for task in running_uploads if task.result() is not None]
 
         elif isinstance(query.user_message.content, str):
             plain_text = query.user_message.content
@@ -438,8 +474,6 @@ class DifyServiceAPIRunner(runner.RequestRunner):
                         think_start = True
                         continue
                     if '</think>' in chunk['answer'] and not think_end:
-                        import re
-
                         content = re.sub(r'^\n</think>', '', chunk['answer'])
                         basic_mode_pending_chunk += content
                         think_end = True
@@ -522,8 +556,6 @@ class DifyServiceAPIRunner(runner.RequestRunner):
                         think_start = True
                         continue
                     if '</think>' in chunk['answer'] and not think_end:
-                        import re
-
                         content = re.sub(r'^\n</think>', '', chunk['answer'])
                         pending_agent_message += content
                         think_end = True
@@ -645,8 +677,6 @@ class DifyServiceAPIRunner(runner.RequestRunner):
                         think_start = True
                         continue
                     if '</think>' in chunk['data']['text'] and not think_end:
-                        import re
-
                         content = re.sub(r'^\n</think>', '', chunk['data']['text'])
                         workflow_contents += content
                         think_end = True
@@ -686,40 +716,29 @@ class DifyServiceAPIRunner(runner.RequestRunner):
                     is_final=is_final,
                 )
 
+    async def dispose(self):
+        """关闭 Dify 客户端的连接池
+
+        流水线重载时旧流水线上可能仍有请求在流式输出，此时推迟到最后一个请求结束再关闭，避免中断回复。
+        """
+        self._disposed = True
+        if self._active_runs == 0:
+            await self.dify_client.close()
+
     async def run(self, query: pipeline_query.Query) -> typing.AsyncGenerator[provider_message.Message, None]:
         """运行请求"""
-        if await query.adapter.is_stream_output_supported():
-            msg_idx = 0
-            if self.pipeline_config['ai']['dify-service-api']['app-type'] == 'chat':
-                async for msg in self._chat_messages_chunk(query):
-                    msg_idx += 1
-                    msg.msg_sequence = msg_idx
-                    yield msg
-            elif self.pipeline_config['ai']['dify-service-api']['app-type'] == 'agent':
-                async for msg in self._agent_chat_messages_chunk(query):
-                    msg_idx += 1
-                    msg.msg_sequence = msg_idx
-                    yield msg
-            elif self.pipeline_config['ai']['dify-service-api']['app-type'] == 'workflow':
-                async for msg in self._workflow_messages_chunk(query):
+        self._active_runs += 1
+        try:
+            if await query.adapter.is_stream_output_supported():
+                msg_idx = 0
+                async for msg in self._stream_handler(query):
                     msg_idx += 1
                     msg.msg_sequence = msg_idx
                     yield msg
             else:
-                raise errors.DifyAPIError(
-                    f'不支持的 Dify 应用类型: {self.pipeline_config["ai"]["dify-service-api"]["app-type"]}'
-                )
-        else:
-            if self.pipeline_config['ai']['dify-service-api']['app-type'] == 'chat':
-                async for msg in self._chat_messages(query):
-                    yield msg
-            elif self.pipeline_config['ai']['dify-service-api']['app-type'] == 'agent':
-                async for msg in self._agent_chat_messages(query):
-                    yield msg
-            elif self.pipeline_config['ai']['dify-service-api']['app-type'] == 'workflow':
-                async for msg in self._workflow_messages(query):
+                async for msg in self._handler(query):
                     yield msg
-            else:
-                raise errors.DifyAPIError(
-                    f'不支持的 Dify 应用类型: {self.pipeline_config["ai"]["dify-service-api"]["app-type"]}'
-                )
+        finally:
+            self._active_runs -= 1
+            if self._disposed and self._active_runs == 0:
+                await self.dify_client.close()
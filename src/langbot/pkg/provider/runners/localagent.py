@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import copy
+import asyncio
 import typing
 from .. import runner
 import langbot_plugin.api.entities.builtin.pipeline.query as pipeline_query
@@ -39,8 +40,6 @@ class LocalAgentRunner(runner.RequestRunner):
         self, query: pipeline_query.Query
     ) -> typing.AsyncGenerator[provider_message.Message | provider_message.MessageChunk, None]:
         """运行请求"""
-        pending_tool_calls = []
-
         # Get knowledge bases list (new field)
         kb_uuids = query.pipeline_config['ai']['local-agent'].get('knowledge-bases', [])
 
@@ -66,13 +65,12 @@ class LocalAgentRunner(runner.RequestRunner):
             # only support text for now
             all_results: list[rag_context.RetrievalResultEntry] = []
 
-            # Retrieve from each knowledge base
-            for kb_uuid in kb_uuids:
+            async def retrieve_from_kb(kb_uuid: str) -> list[rag_context.RetrievalResultEntry]:
                 kb = await self.ap.rag_mgr.get_knowledge_base_by_uuid(kb_uuid)
 
                 if not kb:
                     self.ap.logger.warning(f'Knowledge base {kb_uuid} not found, skipping')
-                    continue
+                    return []
 
                 # Get top_k based on KB type
                 if kb.get_type() == 'internal':
@@ -82,7 +80,18 @@ class LocalAgentRunner(runner.RequestRunner):
                 else:
                     top_k = 5  # default fallback
 
-                result = await kb.retrieve(user_message_text, top_k)
+                return await kb.retrieve(user_message_text, top_k)
+
+            # Retrieve from all knowledge bases concurrently, results are merged in the configured order
+            kb_results = await asyncio.gather(
+                *(retrieve_from_kb(kb_uuid) for kb_uuid in kb_uuids),
+                return_exceptions=True,
+            )
+
+            for kb_uuid, result in zip(kb_uuids, kb_results):
+                if isinstance(result, BaseException):
+                    self.ap.logger.error(f'Failed to retrieve from knowledge base {kb_uuid}: {result}')
+                    continue
 
                 if result:
                     all_results.extend(result)
@@ -112,7 +121,8 @@ class LocalAgentRunner(runner.RequestRunner):
                     ce.text = final_user_message_text
                     break
 
-        req_messages = query.prompt.messages.copy() + query.messages.copy() + [user_message]
+        # 列表拼接本身就会生成新列表，无需先复制各部分
+        req_messages = query.prompt.messages + query.messages + [user_message]
 
         try:
             is_stream = await query.adapter.is_stream_output_supported()
@@ -206,38 +216,43 @@ class LocalAgentRunner(runner.RequestRunner):
 
         req_messages.append(final_msg)
 
-        # 持续请求，只要还有待处理的工具调用就继续处理调用
-        while pending_tool_calls:
-            for tool_call in pending_tool_calls:
-                try:
-                    func = tool_call.function
-
-                    parameters = json.loads(func.arguments)
-
-                    func_ret = await self.ap.tool_mgr.execute_func_call(func.name, parameters, query=query)
-                    if is_stream:
-                        msg = provider_message.MessageChunk(
-                            role='tool',
-                            content=json.dumps(func_ret, ensure_ascii=False),
-                            tool_call_id=tool_call.id,
-                        )
-                    else:
-                        msg = provider_message.Message(
-                            role='tool',
-                            content=json.dumps(func_ret, ensure_ascii=False),
-                            tool_call_id=tool_call.id,
-                        )
+        async def execute_tool_call(
+            tool_call: provider_message.ToolCall,
+        ) -> provider_message.Message | provider_message.MessageChunk:
+            try:
+                func = tool_call.function
 
-                    yield msg
+                parameters = json.loads(func.arguments)
 
-                    req_messages.append(msg)
-                except Exception as e:
-                    # 工具调用出错，添加一个报错信息到 req_messages
-                    err_msg = provider_message.Message(role='tool', content=f'err: {e}', tool_call_id=tool_call.id)
+                func_ret = await self.ap.tool_mgr.execute_func_call(func.name, parameters, query=query)
+                if is_stream:
+                    return provider_message.MessageChunk(
+                        role='tool',
+                        content=json.dumps(func_ret, ensure_ascii=False),
+                        tool_call_id=tool_call.id,
+                    )
+                else:
+                    return provider_message.Message(
+                        role='tool',
+                        content=json.dumps(func_ret, ensure_ascii=False),
+                        tool_call_id=tool_call.id,
+                    )
+            except Exception as e:
+                # 工具调用出错，添加一个报错信息到 req_messages
+                return provider_message.Message(role='tool', content=f'err: {e}', tool_call_id=tool_call.id)
 
-                    yield err_msg
+        # 持续请求，只要还有待处理的工具调用就继续处理调用
+        while pending_tool_calls:
+            if len(pending_tool_calls) == 1:
+                tool_msgs = [await execute_tool_call(pending_tool_calls[0])]
+            else:
+                # 同一轮的工具调用互不依赖，并发执行，结果按调用顺序返回
+                tool_msgs = await asyncio.gather(*(execute_tool_call(tool_call) for tool_call in pending_tool_calls))
+
+            for msg in tool_msgs:
+                yield msg
 
-                    req_messages.append(err_msg)
+                req_messages.append(msg)
 
             self.ap.logger.debug(
                 f'localagent req: query={query.query_id} req_messages={req_messages} use_llm_model={query.use_llm_model_uuid}'
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import typing
 import json
+import time
 import uuid
 import aiohttp
+import jwt
 
 from .. import runner
 from ...core import app
@@ -194,13 +196,11 @@ class N8nServiceAPIRunner(runner.RequestRunner):
                 self.ap.logger.debug(f'using basic auth: {self.basic_username}')
             elif self.auth_type == 'jwt':
                 # 使用JWT认证
-                import jwt
-                import time
-
-                # 创建JWT令牌
+                # 创建JWT令牌，exp 与 iat 取自同一时刻
+                now = int(time.time())
                 payload_jwt = {
-                    'exp': int(time.time()) + 3600,  # 1小时过期
-                    'iat': int(time.time()),
+                    'exp': now + 3600,  # 1小时过期
+                    'iat': now,
                     'sub': 'n8n-webhook',
                 }
                 token = jwt.encode(payload_jwt, self.jwt_secret, algorithm=self.jwt_algorithm)
@@ -142,7 +142,8 @@ class TboxAPIRunner(runner.RequestRunner):
         think_start = False
         think_end = False
         for chunk in response:
-            if chunk.get('type', '') == 'chunk':
+            chunk_type = chunk.get('type', '')
+            if chunk_type == 'chunk':
                 """
                 Tbox返回的消息内容chunk结构
                 {'lane': 'default', 'payload': {'conversationId': '20250918tBI947065406', 'messageId': '20250918TB1f53230954', 'text': '️'}, 'type': 'chunk'}
@@ -156,24 +157,28 @@ class TboxAPIRunner(runner.RequestRunner):
                 if not conversation_id:
                     conversation_id = payload.get('conversationId')
                     query.session.using_conversation.uuid = conversation_id
-                if payload.get('text'):
+                text = payload.get('text')
+                if text:
                     idx_msg += 1
-                    pending_content += payload.get('text')
-            elif chunk.get('type', '') == 'thinking' and not remove_think:
+                    pending_content += text
+            elif chunk_type == 'thinking' and not remove_think:
                 """
                 Tbox返回的思考过程chunk结构
                 {'payload': '{"ext_data":{"text":"日期"},"event":"flow.node.llm.thinking","entity":{"node_type":"text-completion","execute_id":"6","group_id":0,"parent_execute_id":"6","node_name":"模型推理","node_id":"TC_5u6gl0"}}', 'type': 'thinking'}
                 """
-                payload = json.loads(chunk.get('payload', '{}'))
-                if payload.get('ext_data', {}).get('text'):
+                payload = chunk.get('payload', '{}')
+                # 思考过程的 payload 是 JSON 字符串，只在确实为字符串时解析一次
+                if isinstance(payload, (str, bytes, bytearray)):
+                    payload = json.loads(payload)
+                content = payload.get('ext_data', {}).get('text')
+                if content:
                     idx_msg += 1
-                    content = payload.get('ext_data', {}).get('text')
                     if not think_start:
                         think_start = True
                         pending_content += f'<think>\n{content}'
                     else:
                         pending_content += content
-            elif chunk.get('type', '') == 'error':
+            elif chunk_type == 'error':
                 raise TboxAPIError(
                     f'Tbox API 请求失败: status_code={chunk.get("status_code")} message={chunk.get("message")} request_id={chunk.get("request_id")} '
                 )
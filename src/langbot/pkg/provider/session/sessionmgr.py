@@ -15,18 +15,24 @@ class SessionManager:
 
     session_list: list[provider_session.Session]
 
+    session_index: dict[tuple, provider_session.Session]
+    """按 (launcher_type, launcher_id) 索引的会话，与 session_list 同步维护"""
+
     def __init__(self, ap: app.Application):
         self.ap = ap
         self.session_list = []
+        self.session_index = {}
 
     async def initialize(self):
         pass
 
     async def get_session(self, query: pipeline_query.Query) -> provider_session.Session:
         """获取会话"""
-        for session in self.session_list:
-            if query.launcher_type == session.launcher_type and query.launcher_id == session.launcher_id:
-                return session
+        session_key = (query.launcher_type, query.launcher_id)
+
+        session = self.session_index.get(session_key)
+        if session is not None:
+            return session
 
         session_concurrency = self.ap.instance_config.data['concurrency']['session']
 
@@ -37,6 +43,7 @@ class SessionManager:
         )
         session._semaphore = asyncio.Semaphore(session_concurrency)
         self.session_list.append(session)
+        self.session_index[session_key] = session
         return session
 
     async def get_conversation(
@@ -52,18 +59,18 @@ class SessionManager:
         if not session.conversations:
             session.conversations = []
 
-        # set prompt
-        prompt_messages = []
+        if session.using_conversation is None or session.using_conversation.pipeline_uuid != pipeline_uuid:
+            # set prompt, only needed when a new conversation is created
+            prompt_messages = []
 
-        for prompt_message in prompt_config:
-            prompt_messages.append(provider_message.Message(**prompt_message))
+            for prompt_message in prompt_config:
+                prompt_messages.append(provider_message.Message(**prompt_message))
 
-        prompt = provider_prompt.Prompt(
-            name='default',
-            messages=prompt_messages,
-        )
+            prompt = provider_prompt.Prompt(
+                name='default',
+                messages=prompt_messages,
+            )
 
-        if session.using_conversation is None or session.using_conversation.pipeline_uuid != pipeline_uuid:
             conversation = provider_session.Conversation(
                 prompt=prompt,
                 messages=[],
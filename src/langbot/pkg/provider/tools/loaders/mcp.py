@@ -41,6 +41,9 @@ class RuntimeMCPSession:
 
     functions: list[resource_tool.LLMTool] = []
 
+    function_index: dict[str, resource_tool.LLMTool] = {}
+    """工具名到工具的索引，随 functions 一同刷新，供调用时按名查找"""
+
     enable: bool
 
     # connected: bool
@@ -62,6 +65,7 @@ class RuntimeMCPSession:
 
         self.exit_stack = AsyncExitStack()
         self.functions = []
+        self.function_index = {}
 
         self.status = MCPSessionStatus.CONNECTING
 
@@ -131,6 +135,7 @@ class RuntimeMCPSession:
                 if self.exit_stack:
                     await self.exit_stack.aclose()
                 self.functions.clear()
+                self.function_index.clear()
                 self.session = None
             except Exception as e:
                 self.ap.logger.error(f'Error cleaning up MCP session {self.server_name}: {e}\n{traceback.format_exc()}')
@@ -155,6 +160,7 @@ class RuntimeMCPSession:
 
     async def refresh(self):
         self.functions.clear()
+        self.function_index.clear()
 
         tools = await self.session.list_tools()
 
@@ -170,19 +176,22 @@ class RuntimeMCPSession:
 
             func.__name__ = tool.name
 
-            self.functions.append(
-                resource_tool.LLMTool(
-                    name=tool.name,
-                    human_desc=tool.description,
-                    description=tool.description,
-                    parameters=tool.inputSchema,
-                    func=func,
-                )
+            function = resource_tool.LLMTool(
+                name=tool.name,
+                human_desc=tool.description,
+                description=tool.description,
+                parameters=tool.inputSchema,
+                func=func,
             )
+            self.functions.append(function)
+            self.function_index.setdefault(tool.name, function)
 
     def get_tools(self) -> list[resource_tool.LLMTool]:
         return self.functions
 
+    def get_tool(self, name: str) -> resource_tool.LLMTool | None:
+        return self.function_index.get(name)
+
     def get_runtime_info_dict(self) -> dict:
         return {
             'status': self.status.value,
@@ -249,11 +258,19 @@ class MCPLoader(loader.ToolLoader):
         result = await self.ap.persistence_mgr.execute_async(sqlalchemy.select(persistence_mcp.MCPServer))
         servers = result.all()
 
-        for server in servers:
-            config = self.ap.persistence_mgr.serialize_model(persistence_mcp.MCPServer, server)
+        server_configs = [
+            self.ap.persistence_mgr.serialize_model(persistence_mcp.MCPServer, server) for server in servers
+        ]
 
-            task = asyncio.create_task(self.host_mcp_server(config))
-            self._hosted_mcp_tasks.append(task)
+        # 所有服务器在同一个后台任务中并发启动，不阻塞初始化
+        task = asyncio.create_task(self._host_mcp_servers(server_configs))
+        self._hosted_mcp_tasks.append(task)
+
+    async def _host_mcp_servers(self, server_configs: list[dict]):
+        # host_mcp_server 自行处理并记录错误，单个服务器失败不会取消其他服务器的启动
+        async with asyncio.TaskGroup() as tg:
+            for server_config in server_configs:
+                tg.create_task(self.host_mcp_server(server_config))
 
     async def host_mcp_server(self, server_config: dict):
         self.ap.logger.debug(f'Loading MCP server {server_config}')
@@ -322,29 +339,37 @@ class MCPLoader(loader.ToolLoader):
 
         return all_functions
 
+    def get_tool(self, name: str) -> resource_tool.LLMTool | None:
+        """按名称查找工具，找不到时返回 None"""
+        for session in self.sessions.values():
+            function = session.get_tool(name)
+            if function is not None:
+                return function
+        return None
+
     async def has_tool(self, name: str) -> bool:
         """检查工具是否存在"""
-        for session in self.sessions.values():
-            for function in session.get_tools():
-                if function.name == name:
-                    return True
-        return False
+        return self.get_tool(name) is not None
 
     async def invoke_tool(self, name: str, parameters: dict, query: pipeline_query.Query) -> typing.Any:
         """执行工具调用"""
-        for session in self.sessions.values():
-            for function in session.get_tools():
-                if function.name == name:
-                    self.ap.logger.debug(f'Invoking MCP tool: {name} with parameters: {parameters}')
-                    try:
-                        result = await function.func(**parameters)
-                        self.ap.logger.debug(f'MCP tool {name} executed successfully')
-                        return result
-                    except Exception as e:
-                        self.ap.logger.error(f'Error invoking MCP tool {name}: {e}\n{traceback.format_exc()}')
-                        raise
+        function = self.get_tool(name)
+        if function is None:
+            raise ValueError(f'Tool not found: {name}')
+
+        return await self.invoke_function(function, parameters)
 
-        raise ValueError(f'Tool not found: {name}')
+    async def invoke_function(self, function: resource_tool.LLMTool, parameters: dict) -> typing.Any:
+        """执行已查找到的工具"""
+        name = function.name
+        self.ap.logger.debug(f'Invoking MCP tool: {name} with parameters: {parameters}')
+        try:
+            result = await function.func(**parameters)
+            self.ap.logger.debug(f'MCP tool {name} executed successfully')
+            return result
+        except Exception as e:
+            self.ap.logger.error(f'Error invoking MCP tool {name}: {e}\n{traceback.format_exc()}')
+            raise
 
     async def remove_mcp_server(self, server_name: str):
         """移除 MCP 服务器"""
@@ -389,11 +414,17 @@ class MCPLoader(loader.ToolLoader):
     async def shutdown(self):
         """关闭所有工具"""
         self.ap.logger.info('Shutting down all MCP sessions...')
-        for server_name, session in list(self.sessions.items()):
+
+        async def shutdown_session(server_name: str, session: RuntimeMCPSession):
             try:
                 await session.shutdown()
                 self.ap.logger.debug(f'Shutdown MCP session: {server_name}')
             except Exception as e:
                 self.ap.logger.error(f'Error shutting down MCP session {server_name}: {e}\n{traceback.format_exc()}')
+
+        # 各会话的关闭最长会等待 5 秒，并发关闭避免逐个累加
+        async with asyncio.TaskGroup() as tg:
+            for server_name, session in list(self.sessions.items()):
+                tg.create_task(shutdown_session(server_name, session))
         self.sessions.clear()
         self.ap.logger.info('All MCP sessions shutdown complete')
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import collections
 import typing
 import traceback
 
 from langbot_plugin.api.entities.events import pipeline_query
 
 from .. import loader
+from ....core import app
 import langbot_plugin.api.entities.builtin.resource.tool as resource_tool
 
 
+PLUGIN_TOOL_CACHE_SIZE = 256
+"""Max cached LLMTool objects; least recently used tools are evicted first"""
+
+
 # @loader.loader_class('plugin-tool-loader')
 class PluginToolLoader(loader.ToolLoader):
     """插件工具加载器。
@@ -16,19 +22,51 @@ class PluginToolLoader(loader.ToolLoader):
     本加载器中不存储工具信息，仅负责从插件系统中获取工具信息。
     """
 
+    tool_cache: collections.OrderedDict[str, resource_tool.LLMTool]
+    """按工具名缓存已构建的 LLMTool，工具声明未变化时直接复用；插件卸载后残留的工具按 LRU 淘汰"""
+
+    def __init__(self, ap: app.Application):
+        super().__init__(ap)
+        self.tool_cache = collections.OrderedDict()
+
+    def _build_tool(self, name: str, human_desc: str, description: str, parameters: dict) -> resource_tool.LLMTool:
+        cached = self.tool_cache.get(name)
+        if (
+            cached is not None
+            and cached.human_desc == human_desc
+            and cached.description == description
+            and cached.parameters == parameters
+        ):
+            self.tool_cache.move_to_end(name)
+            return cached
+
+        tool_obj = resource_tool.LLMTool(
+            name=name,
+            human_desc=human_desc,
+            description=description,
+            parameters=parameters,
+            func=lambda parameters: {},
+        )
+        self.tool_cache[name] = tool_obj
+        self.tool_cache.move_to_end(name)
+        if len(self.tool_cache) > PLUGIN_TOOL_CACHE_SIZE:
+            self.tool_cache.popitem(last=False)
+
+        return tool_obj
+
     async def get_tools(self, bound_plugins: list[str] | None = None) -> list[resource_tool.LLMTool]:
         # 从插件系统获取工具（内容函数）
         all_functions: list[resource_tool.LLMTool] = []
 
         for tool in await self.ap.plugin_connector.list_tools(bound_plugins):
-            tool_obj = resource_tool.LLMTool(
-                name=tool.metadata.name,
-                human_desc=tool.metadata.description.en_US,
-                description=tool.spec['llm_prompt'],
-                parameters=tool.spec['parameters'],
-                func=lambda parameters: {},
+            all_functions.append(
+                self._build_tool(
+                    tool.metadata.name,
+                    tool.metadata.description.en_US,
+                    tool.spec['llm_prompt'],
+                    tool.spec['parameters'],
+                )
             )
-            all_functions.append(tool_obj)
 
         return all_functions
 
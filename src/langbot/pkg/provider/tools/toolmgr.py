@@ -97,10 +97,13 @@ class ToolManager:
 
         if await self.plugin_tool_loader.has_tool(name):
             return await self.plugin_tool_loader.invoke_tool(name, parameters, query)
-        elif await self.mcp_tool_loader.has_tool(name):
-            return await self.mcp_tool_loader.invoke_tool(name, parameters, query)
-        else:
-            raise ValueError(f'未找到工具: {name}')
+
+        # 查找与调用合并为一次遍历，不再先 has_tool 再在 invoke_tool 中重复查找
+        mcp_tool = self.mcp_tool_loader.get_tool(name)
+        if mcp_tool is not None:
+            return await self.mcp_tool_loader.invoke_function(mcp_tool, parameters)
+
+        raise ValueError(f'未找到工具: {name}')
 
     async def shutdown(self):
         """关闭所有工具"""
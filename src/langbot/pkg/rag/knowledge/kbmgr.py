@@ -1,5 +1,6 @@
 from __future__ import annotations
 import traceback
+import secrets
 import uuid
 import zipfile
 import io
@@ -165,7 +166,7 @@ class RuntimeKnowledgeBase(KnowledgeBaseInterface):
                     if file_name.startswith('__MACOSX'):
                         continue
 
-                    extracted_file_id = file_name + '_' + str(uuid.uuid4())[:8] + '.' + extension
+                    extracted_file_id = file_name + '_' + secrets.token_hex(4) + '.' + extension
                     # save file to storage
 
                     await self.ap.storage_mgr.storage_provider.save(extracted_file_id, file_content)
@@ -199,13 +200,10 @@ class RuntimeKnowledgeBase(KnowledgeBaseInterface):
         # delete vector
         await self.ap.vector_db_mgr.vector_db.delete_by_file_id(self.knowledge_base_entity.uuid, file_id)
 
-        # delete chunk
-        await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.delete(persistence_rag.Chunk).where(persistence_rag.Chunk.file_id == file_id)
-        )
-
-        await self.ap.persistence_mgr.execute_async(
-            sqlalchemy.delete(persistence_rag.File).where(persistence_rag.File.uuid == file_id)
+        # delete chunks and file in one transaction
+        await self.ap.persistence_mgr.execute_many_async(
+            sqlalchemy.delete(persistence_rag.Chunk).where(persistence_rag.Chunk.file_id == file_id),
+            sqlalchemy.delete(persistence_rag.File).where(persistence_rag.File.uuid == file_id),
         )
 
     def get_uuid(self) -> str:
@@ -227,11 +225,12 @@ class RuntimeKnowledgeBase(KnowledgeBaseInterface):
 class RAGManager:
     ap: app.Application
 
-    knowledge_bases: list[KnowledgeBaseInterface]
+    knowledge_bases: dict[str, KnowledgeBaseInterface]
+    """knowledge base uuid to runtime knowledge base, in load order"""
 
     def __init__(self, ap: app.Application):
         self.ap = ap
-        self.knowledge_bases = []
+        self.knowledge_bases = {}
 
     async def initialize(self):
         await self.load_knowledge_bases_from_db()
@@ -239,7 +238,7 @@ class RAGManager:
     async def load_knowledge_bases_from_db(self):
         self.ap.logger.info('Loading knowledge bases from db...')
 
-        self.knowledge_bases = []
+        self.knowledge_bases = {}
 
         # Load internal knowledge bases
         result = await self.ap.persistence_mgr.execute_async(sqlalchemy.select(persistence_rag.KnowledgeBase))
@@ -281,7 +280,7 @@ class RAGManager:
 
         await runtime_knowledge_base.initialize()
 
-        self.knowledge_bases.append(runtime_knowledge_base)
+        self.knowledge_bases[runtime_knowledge_base.get_uuid()] = runtime_knowledge_base
 
         return runtime_knowledge_base
 
@@ -305,7 +304,7 @@ class RAGManager:
 
         await external_kb.initialize()
 
-        self.knowledge_bases.append(external_kb)
+        self.knowledge_bases[external_kb.get_uuid()] = external_kb
 
         # Trigger sync to create the instance immediately (for manual creation)
         # Skip sync during batch loading from DB to avoid multiple sync calls
@@ -319,20 +318,12 @@ class RAGManager:
         return external_kb
 
     async def get_knowledge_base_by_uuid(self, kb_uuid: str) -> KnowledgeBaseInterface | None:
-        for kb in self.knowledge_bases:
-            if kb.get_uuid() == kb_uuid:
-                return kb
-        return None
+        return self.knowledge_bases.get(kb_uuid)
 
     async def remove_knowledge_base_from_runtime(self, kb_uuid: str):
-        for kb in self.knowledge_bases:
-            if kb.get_uuid() == kb_uuid:
-                self.knowledge_bases.remove(kb)
-                return
+        self.knowledge_bases.pop(kb_uuid, None)
 
     async def delete_knowledge_base(self, kb_uuid: str):
-        for kb in self.knowledge_bases:
-            if kb.get_uuid() == kb_uuid:
-                await kb.dispose()
-                self.knowledge_bases.remove(kb)
-                return
+        kb = self.knowledge_bases.pop(kb_uuid, None)
+        if kb is not None:
+            await kb.dispose()
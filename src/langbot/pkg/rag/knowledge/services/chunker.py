@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import logging
 from typing import List
 from langbot.pkg.rag.knowledge.services import base_service
 from langbot.pkg.core import app
@@ -45,5 +46,6 @@ class Chunker(base_service.BaseService):
         # Run the synchronous splitting logic in a separate thread
         chunks = await self._run_sync(self._split_text_sync, text)
         self.ap.logger.info(f'Text chunked into {len(chunks)} pieces.')
-        self.ap.logger.debug(f'Chunks: {json.dumps(chunks, indent=4, ensure_ascii=False)}')
+        if self.ap.logger.isEnabledFor(logging.DEBUG):
+            self.ap.logger.debug(f'Chunks: {json.dumps(chunks, indent=4, ensure_ascii=False)}')
         return chunks
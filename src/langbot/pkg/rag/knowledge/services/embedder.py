@@ -17,20 +17,16 @@ class Embedder(BaseService):
         self, kb_id: str, file_id: str, chunks: List[str], embedding_model: RuntimeEmbeddingModel
     ) -> list[persistence_rag.Chunk]:
         # save chunk to db
-        chunk_entities: list[persistence_rag.Chunk] = []
-        chunk_ids: list[str] = []
-
-        for chunk_text in chunks:
-            chunk_uuid = str(uuid.uuid4())
-            chunk_ids.append(chunk_uuid)
-            chunk_entity = persistence_rag.Chunk(uuid=chunk_uuid, file_id=file_id, text=chunk_text)
-            chunk_entities.append(chunk_entity)
-
+        chunk_ids: list[str] = [str(uuid.uuid4()) for _ in chunks]
         chunk_dicts = [
-            self.ap.persistence_mgr.serialize_model(persistence_rag.Chunk, chunk) for chunk in chunk_entities
+            {'uuid': chunk_uuid, 'file_id': file_id, 'text': chunk_text}
+            for chunk_uuid, chunk_text in zip(chunk_ids, chunks)
         ]
+        chunk_entities = [persistence_rag.Chunk(**chunk_dict) for chunk_dict in chunk_dicts]
 
-        await self.ap.persistence_mgr.execute_async(sqlalchemy.insert(persistence_rag.Chunk).values(chunk_dicts))
+        # pass the rows as parameters so the driver runs an executemany, rather than
+        # compiling one multi-VALUES statement with a bind parameter per cell
+        await self.ap.persistence_mgr.execute_async(sqlalchemy.insert(persistence_rag.Chunk), chunk_dicts)
 
         # get embeddings
         embeddings_list: list[list[float]] = await embedding_model.requester.invoke_embedding(
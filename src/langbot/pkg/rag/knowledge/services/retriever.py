@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+
 from . import base_service
 from ....core import app
 from ....provider.modelmgr.requester import RuntimeEmbeddingModel
@@ -7,6 +9,10 @@ from langbot_plugin.api.entities.builtin.rag import context as rag_context
 from langbot_plugin.api.entities.builtin.provider.message import ContentElement
 
 
+QUERY_EMBEDDING_CACHE_SIZE = 256
+"""Max cached query embeddings per embedding model"""
+
+
 class Retriever(base_service.BaseService):
     def __init__(self, ap: app.Application):
         super().__init__()
@@ -19,13 +25,9 @@ class Retriever(base_service.BaseService):
             f"Retrieving for query: '{query[:10]}' with k={k} using {embedding_model.model_entity.uuid}"
         )
 
-        query_embedding: list[float] = await embedding_model.requester.invoke_embedding(
-            model=embedding_model,
-            input_text=[query],
-            extra_args={},  # TODO: add extra args
-        )
+        query_embedding = await self._embed_query(query, embedding_model)
 
-        vector_results = await self.ap.vector_db_mgr.vector_db.search(kb_id, query_embedding[0], k)
+        vector_results = await self.ap.vector_db_mgr.vector_db.search(kb_id, query_embedding, k)
 
         # 'ids' shape mirrors the Chroma-style response contract for compatibility
         matched_vector_ids = vector_results.get('ids', [[]])[0]
@@ -48,3 +50,31 @@ class Retriever(base_service.BaseService):
             result.append(entry)
 
         return result
+
+    async def _embed_query(self, query: str, embedding_model: RuntimeEmbeddingModel) -> list[float]:
+        """Embed the query text, reusing the result for identical text on the same model
+
+        Embeddings are deterministic for a given model, and a pipeline bound to several
+        knowledge bases on one model retrieves with the same text once per knowledge base.
+        """
+        cache = embedding_model.query_embedding_cache
+        cache_key = hashlib.sha256(query.encode('utf-8')).hexdigest()
+
+        query_embedding = cache.get(cache_key)
+        if query_embedding is not None:
+            cache.move_to_end(cache_key)
+            return query_embedding
+
+        query_embedding = (
+            await embedding_model.requester.invoke_embedding(
+                model=embedding_model,
+                input_text=[query],
+                extra_args={},  # TODO: add extra args
+            )
+        )[0]
+
+        cache[cache_key] = query_embedding
+        if len(cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return query_embedding
@@ -3,6 +3,17 @@ import inspect
 import typing
 
 
+# Python 类型名到 JSON Schema 类型名的映射
+TYPE_NAME_MAPPING = {
+    'str': 'string',
+    'int': 'integer',
+    'float': 'number',
+    'bool': 'boolean',
+    'list': 'array',
+    'dict': 'object',
+}
+
+
 def get_func_schema(function: typing.Callable) -> dict:
     """
     Return the data schema of a function.
@@ -68,18 +79,7 @@ def get_func_schema(function: typing.Callable) -> dict:
             continue
 
         param_type = param.annotation.__name__
-
-        type_name_mapping = {
-            'str': 'string',
-            'int': 'integer',
-            'float': 'number',
-            'bool': 'boolean',
-            'list': 'array',
-            'dict': 'object',
-        }
-
-        if param_type in type_name_mapping:
-            param_type = type_name_mapping[param_type]
+        param_type = TYPE_NAME_MAPPING.get(param_type, param_type)
 
         parameters['properties'][param.name] = {
             'type': param_type,
@@ -97,8 +97,7 @@ def get_func_schema(function: typing.Callable) -> dict:
             if len(array_type_tuple) > 0:
                 array_type = array_type_tuple[0]
 
-            if array_type in type_name_mapping:
-                array_type = type_name_mapping[array_type]
+            array_type = TYPE_NAME_MAPPING.get(array_type, array_type)
 
             parameters['properties'][param.name]['items'] = {
                 'type': array_type,
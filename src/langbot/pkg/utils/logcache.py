@@ -8,6 +8,8 @@ MAX_CACHED_PAGES = 10
 class LogPage:
     """日志页"""
 
+    __slots__ = ('number', 'logs')
+
     number: int
     """页码"""
 
@@ -52,12 +54,13 @@ class LogCache:
         start_offset: int,
     ) -> tuple[str, int, int]:
         """获取指定页码和偏移量的日志"""
-        final_logs_str = ''
+        # collect page fragments and join once, instead of re-copying the growing string per page
+        fragments: list[str] = []
 
         for page in self.log_pages:
             if page.number == start_page_number:
-                final_logs_str += '\n'.join(page.logs[start_offset:])
+                fragments.append('\n'.join(page.logs[start_offset:]))
             elif page.number > start_page_number:
-                final_logs_str += '\n'.join(page.logs)
+                fragments.append('\n'.join(page.logs))
 
-        return final_logs_str, page.number, len(page.logs)
+        return ''.join(fragments), page.number, len(page.logs)
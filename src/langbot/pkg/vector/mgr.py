@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import typing
+
 from ..core import app
 from .vdb import VectorDatabase
 from .vdbs.chroma import ChromaVectorDatabase
@@ -9,6 +11,52 @@ from .vdbs.milvus import MilvusVectorDatabase
 from .vdbs.pgvector_db import PgVectorDatabase
 
 
+def _build_chroma(ap: app.Application, kb_config: dict) -> VectorDatabase:
+    return ChromaVectorDatabase(ap)
+
+
+def _build_qdrant(ap: app.Application, kb_config: dict) -> VectorDatabase:
+    return QdrantVectorDatabase(ap)
+
+
+def _build_seekdb(ap: app.Application, kb_config: dict) -> VectorDatabase:
+    return SeekDBVectorDatabase(ap)
+
+
+def _build_milvus(ap: app.Application, kb_config: dict) -> VectorDatabase:
+    # Get Milvus configuration
+    milvus_config = kb_config.get('milvus', {})
+    uri = milvus_config.get('uri', './data/milvus.db')
+    token = milvus_config.get('token')
+    return MilvusVectorDatabase(ap, uri=uri, token=token)
+
+
+def _build_pgvector(ap: app.Application, kb_config: dict) -> VectorDatabase:
+    # Get pgvector configuration
+    pgvector_config = kb_config.get('pgvector', {})
+    connection_string = pgvector_config.get('connection_string')
+    if connection_string:
+        return PgVectorDatabase(ap, connection_string=connection_string)
+
+    # Use individual parameters
+    host = pgvector_config.get('host', 'localhost')
+    port = pgvector_config.get('port', 5432)
+    database = pgvector_config.get('database', 'langbot')
+    user = pgvector_config.get('user', 'postgres')
+    password = pgvector_config.get('password', 'postgres')
+    return PgVectorDatabase(ap, host=host, port=port, database=database, user=user, password=password)
+
+
+VDB_BUILDERS: dict[str, tuple[str, typing.Callable[[app.Application, dict], VectorDatabase]]] = {
+    'chroma': ('Chroma', _build_chroma),
+    'qdrant': ('Qdrant', _build_qdrant),
+    'seekdb': ('SeekDB', _build_seekdb),
+    'milvus': ('Milvus', _build_milvus),
+    'pgvector': ('pgvector', _build_pgvector),
+}
+"""Vector database backends keyed by the `vdb.use` config value: (display name, builder)"""
+
+
 class VectorDBManager:
     ap: app.Application
     vector_db: VectorDatabase = None
@@ -21,48 +69,10 @@ class VectorDBManager:
         if kb_config:
             vdb_type = kb_config.get('use')
 
-            if vdb_type == 'chroma':
-                self.vector_db = ChromaVectorDatabase(self.ap)
-                self.ap.logger.info('Initialized Chroma vector database backend.')
-
-            elif vdb_type == 'qdrant':
-                self.vector_db = QdrantVectorDatabase(self.ap)
-                self.ap.logger.info('Initialized Qdrant vector database backend.')
-            elif vdb_type == 'seekdb':
-                self.vector_db = SeekDBVectorDatabase(self.ap)
-                self.ap.logger.info('Initialized SeekDB vector database backend.')
-
-            elif vdb_type == 'milvus':
-                # Get Milvus configuration
-                milvus_config = kb_config.get('milvus', {})
-                uri = milvus_config.get('uri', './data/milvus.db')
-                token = milvus_config.get('token')
-                self.vector_db = MilvusVectorDatabase(self.ap, uri=uri, token=token)
-                self.ap.logger.info('Initialized Milvus vector database backend.')
-
-            elif vdb_type == 'pgvector':
-                # Get pgvector configuration
-                pgvector_config = kb_config.get('pgvector', {})
-                connection_string = pgvector_config.get('connection_string')
-                if connection_string:
-                    self.vector_db = PgVectorDatabase(self.ap, connection_string=connection_string)
-                else:
-                    # Use individual parameters
-                    host = pgvector_config.get('host', 'localhost')
-                    port = pgvector_config.get('port', 5432)
-                    database = pgvector_config.get('database', 'langbot')
-                    user = pgvector_config.get('user', 'postgres')
-                    password = pgvector_config.get('password', 'postgres')
-                    self.vector_db = PgVectorDatabase(
-                        self.ap,
-                        host=host,
-                        port=port,
-                        database=database,
-                        user=user,
-                        password=password
-                    )
-                self.ap.logger.info('Initialized pgvector database backend.')
-
+            if vdb_type in VDB_BUILDERS:
+                display_name, builder = VDB_BUILDERS[vdb_type]
+                self.vector_db = builder(self.ap, kb_config)
+                self.ap.logger.info(f'Initialized {display_name} vector database backend.')
             else:
                 self.vector_db = ChromaVectorDatabase(self.ap)
                 self.ap.logger.warning('No valid vector database backend configured, defaulting to Chroma.')
@@ -259,8 +259,7 @@ class PgVectorDatabase(VectorDatabase):
         Args:
             collection: Collection name to delete
         """
-        if collection in self._collections:
-            self._collections.remove(collection)
+        self._collections.discard(collection)
 
         async with self.AsyncSessionLocal() as session:
             try:
@@ -0,0 +1,82 @@
+"""
+WebSocket chat stream coalescing unit tests
+"""
+
+from importlib import import_module
+
+
+def get_websocket_chat_module():
+    return import_module('langbot.pkg.api.http.controller.groups.pipelines.websocket_chat')
+
+
+def make_response(message_id, content: str, is_final: bool = False, session_type: str = 'person') -> dict:
+    return {
+        'type': 'response',
+        'session_type': session_type,
+        'data': {'id': message_id, 'content': content, 'is_final': is_final},
+    }
+
+
+def test_same_id_collapses_to_last_frame():
+    """Intermediate frames of one streamed reply collapse to the latest one"""
+    websocket_chat = get_websocket_chat_module()
+
+    messages = [
+        make_response(1, 'He'),
+        make_response(1, 'Hello'),
+        make_response(1, 'Hello, wor'),
+    ]
+
+    assert websocket_chat._coalesce_stream_responses(messages) == [messages[2]]
+
+
+def test_different_ids_and_session_types_are_kept_apart():
+    """Frames only collapse within the same session_type and id"""
+    websocket_chat = get_websocket_chat_module()
+
+    messages = [
+        make_response(1, 'a'),
+        make_response(2, 'b'),
+        make_response(1, 'a', session_type='group'),
+        make_response(2, 'bc'),
+    ]
+
+    assert websocket_chat._coalesce_stream_responses(messages) == [messages[0], messages[2], messages[3]]
+
+
+def test_final_frames_are_kept():
+    """A frame marked is_final is never dropped, even if a later frame shares its id"""
+    websocket_chat = get_websocket_chat_module()
+
+    messages = [
+        make_response(1, 'Hel'),
+        make_response(1, 'Hello', is_final=True),
+        make_response(1, 'Hello again'),
+    ]
+
+    assert websocket_chat._coalesce_stream_responses(messages) == [messages[1], messages[2]]
+
+
+def test_non_response_messages_pass_through_in_order():
+    """Messages that are not stream responses are forwarded untouched and in order"""
+    websocket_chat = get_websocket_chat_module()
+
+    connected = {'type': 'connected', 'data': {'connection_id': 'abc'}}
+    error = {'type': 'error', 'message': 'boom'}
+    malformed = {'type': 'response', 'data': 'not a dict'}
+
+    messages = [
+        connected,
+        make_response(1, 'Hi'),
+        error,
+        make_response(1, 'Hi there'),
+        malformed,
+    ]
+
+    assert websocket_chat._coalesce_stream_responses(messages) == [connected, error, messages[3], malformed]
+
+
+def test_empty_batch():
+    websocket_chat = get_websocket_chat_module()
+
+    assert websocket_chat._coalesce_stream_responses([]) == []
@@ -0,0 +1,58 @@
+"""
+BanWordFilter unit tests
+"""
+
+from unittest.mock import Mock
+from importlib import import_module
+
+
+def get_modules():
+    banwords = import_module('langbot.pkg.pipeline.cntfilter.filters.banwords')
+    entities = import_module('langbot.pkg.pipeline.cntfilter.entities')
+    return banwords, entities
+
+
+async def make_filter(mock_app, words: list[str], mask: str = '*', mask_word: str = ''):
+    banwords, _ = get_modules()
+
+    mock_app.sensitive_meta = Mock()
+    mock_app.sensitive_meta.data = {'words': words, 'mask': mask, 'mask_word': mask_word}
+
+    ban_word_filter = banwords.BanWordFilter(mock_app)
+    await ban_word_filter.initialize()
+    return ban_word_filter
+
+
+async def test_clean_message_passes(mock_app, sample_query):
+    """A message without banned words passes unchanged"""
+    _, entities = get_modules()
+    ban_word_filter = await make_filter(mock_app, ['bad'])
+
+    result = await ban_word_filter.process(sample_query, 'hello world')
+
+    assert result.level == entities.ResultLevel.PASS
+    assert result.replacement == 'hello world'
+    assert result.user_notice == ''
+
+
+async def test_mask_per_character(mock_app, sample_query):
+    """Without mask_word, each matched character is replaced by mask"""
+    _, entities = get_modules()
+    ban_word_filter = await make_filter(mock_app, ['bad', r'wor\w+'], mask='*')
+
+    result = await ban_word_filter.process(sample_query, 'bad words, bad deeds')
+
+    assert result.level == entities.ResultLevel.MASKED
+    assert result.replacement == '*** *****, *** deeds'
+    assert result.user_notice != ''
+
+
+async def test_mask_word(mock_app, sample_query):
+    """With mask_word set, every match is replaced by mask_word as a whole"""
+    _, entities = get_modules()
+    ban_word_filter = await make_filter(mock_app, ['bad', r'wor\w+'], mask='*', mask_word='[x]')
+
+    result = await ban_word_filter.process(sample_query, 'bad words, bad deeds')
+
+    assert result.level == entities.ResultLevel.MASKED
+    assert result.replacement == '[x] [x], [x] deeds'
@@ -115,6 +115,7 @@ async def test_remove_pipeline(mock_app):
     # Remove pipeline
     await manager.remove_pipeline('test-uuid')
     assert len(manager.pipelines) == 0
+    assert await manager.get_pipeline_by_uuid('test-uuid') is None
 
 
 @pytest.mark.asyncio
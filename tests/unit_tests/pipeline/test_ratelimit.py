@@ -98,3 +98,27 @@ async def test_release_access(mock_app, sample_query):
     assert result.result_type == entities.ResultType.CONTINUE
     assert result.new_query == sample_query
     mock_algo.release_access.assert_called_once_with(sample_query, 'person', '12345')
+
+
+@pytest.mark.asyncio
+async def test_fixwin_sweeps_expired_containers(mock_app, sample_query):
+    """Test FixedWindowAlgo drops containers whose window has ended"""
+    fixedwin = import_module('langbot.pkg.pipeline.ratelimit.algos.fixedwin')
+
+    sample_query.pipeline_config = {
+        'safety': {'rate-limit': {'window-length': 60, 'limitation': 10, 'strategy': 'drop'}}
+    }
+
+    algo = fixedwin.FixedWindowAlgo(mock_app)
+    await algo.initialize()
+
+    assert await algo.require_access(sample_query, 'person', '12345')
+    assert 'person_12345' in algo.containers
+
+    # pretend the window ended long ago and the sweep interval has passed
+    algo.containers['person_12345'].expires_at = 0
+    algo.last_sweep = 0
+
+    assert await algo.require_access(sample_query, 'person', '67890')
+    assert 'person_12345' not in algo.containers
+    assert 'person_67890' in algo.containers